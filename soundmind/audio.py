@@ -4,7 +4,8 @@ SoundMind v1 Audio Utilities — Commit 6
 Deterministic, CPU-only audio processing primitives.
 
 Library Stack:
-    - soundfile: WAV I/O (libsndfile-backed)
+    - soundfile: WAV reading (libsndfile-backed)
+    - struct + numpy: PCM-16 WAV writing (canonical 44-byte header)
     - numpy: Array operations
     - scipy.signal.resample_poly: Deterministic resampling
 
@@ -33,12 +34,14 @@ FORBIDDEN:
     - Dithering or noise injection
 """
 
+import os
+import struct
 from math import gcd
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
-from scipy.signal import resample_poly
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 # =============================================================================
@@ -50,6 +53,11 @@ FRAME_MS = 30
 HOP_MS = 10
 EPS = 1e-10  # Fixed epsilon for thresholding
 
+FRAME_TILE_SAMPLES = 1 << 18  # ~1 MiB of float32 per framing tile
+PCM16_TILE_SAMPLES = 1 << 16  # 512 KiB float64 quantization tile per write
+DOWNMIX_COLUMN_MAX_CHANNELS = 8  # np.mean switches to unrolled pairwise sums at 8
+PCM16_SCALE = np.float32(1.0 / 32768.0)  # PCM-16 -> float32 decode scale (exact)
+
 
 # =============================================================================
 # WAV I/O
@@ -68,7 +76,15 @@ def read_wav(path: Path) -> tuple[np.ndarray, int]:
     
     Raises:
         RuntimeError: If file cannot be read
+    
+    Note:
+        Plain PCM-16 WAVs are memory-mapped and scaled in one pass; other
+        formats are decoded by libsndfile.
     """
+    mapped = _map_pcm16(path)
+    if mapped is not None:
+        pcm, sr = mapped
+        return pcm16_to_float(pcm), sr
     samples, sr = sf.read(path, dtype="float32", always_2d=False)
     return samples, sr
 
@@ -88,12 +104,72 @@ def read_wav_int16(path: Path) -> tuple[np.ndarray, int]:
         Integer comparison (== 0) is immune to floating-point
         representation quirks that could arise from normalization.
     """
+    mapped = _map_pcm16(path)
+    if mapped is not None:
+        pcm, sr = mapped
+        return np.array(pcm, dtype=np.int16), sr
     samples, sr = sf.read(path, dtype="int16", always_2d=False)
     return samples, sr
 
 
-
-def write_wav(path: Path, samples: np.ndarray, sample_rate: int = CANONICAL_SAMPLE_RATE) -> None:
+def _map_pcm16(path: Path) -> tuple[np.ndarray, int] | None:
+    """
+    Memory-map the sample data of a plain PCM-16 little-endian WAV.
+    
+    Returns:
+        Tuple of (read-only int16 view shaped like sf.read output,
+        sample_rate), or None if the file is anything else (other
+        encodings, RIFX/RF64, extensible or truncated headers), in which
+        case the caller falls back to libsndfile.
+    
+    Note:
+        Callers must copy out of the map before returning it, so no
+        mapping outlives the call (the file may be rewritten later).
+    """
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            riff = f.read(12)
+            if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+                return None
+            fmt = None
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    return None
+                chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+                if chunk_id == b"fmt ":
+                    body = f.read(chunk_size)
+                    if len(body) < 16:
+                        return None
+                    fmt = struct.unpack("<HHIIHH", body[:16])
+                    if chunk_size & 1:
+                        f.seek(1, os.SEEK_CUR)
+                elif chunk_id == b"data":
+                    data_offset = f.tell()
+                    break
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    except OSError:
+        return None
+    
+    if fmt is None:
+        return None
+    format_tag, channels, sample_rate, _, block_align, bits = fmt
+    if format_tag != 1 or bits != 16 or channels < 1 or block_align != 2 * channels:
+        return None
+    if data_offset + chunk_size > file_size:
+        return None
+    
+    num_frames = chunk_size // block_align
+    shape = (num_frames,) if channels == 1 else (num_frames, channels)
+    if num_frames == 0:
+        return np.zeros(shape, dtype=np.int16), sample_rate
+    pcm = np.memmap(path, dtype="<i2", mode="r", offset=data_offset, shape=shape)
+    return pcm, sample_rate
+
+
+def write_wav(path: Path, samples: np.ndarray, sample_rate: int = CANONICAL_SAMPLE_RATE) -> np.ndarray:
     """
     Write samples to WAV file as PCM 16-bit.
     
@@ -102,14 +178,129 @@ def write_wav(path: Path, samples: np.ndarray, sample_rate: int = CANONICAL_SAMP
         samples: Audio samples (float32, [-1, 1])
         sample_rate: Sample rate (default: 16000)
     
+    Returns:
+        The int16 PCM written (what read_wav_int16() returns for the file)
+    
     Note:
         - Hard clips to [-1, 1] before writing
-        - Writes PCM 16-bit (subtype='PCM_16')
+        - Writes PCM 16-bit (canonical 44-byte RIFF/WAVE header)
         - Deterministic output (no dithering)
     """
-    # Hard clip to prevent overflow
-    clipped = np.clip(samples, -1.0, 1.0)
-    sf.write(path, clipped, sample_rate, subtype="PCM_16")
+    pcm = _to_pcm16(samples)
+    channels = 1 if pcm.ndim == 1 else pcm.shape[1]
+    header = _pcm16_wav_header(len(pcm), channels, sample_rate)
+    
+    # Header + interleaved little-endian PCM, one buffered write each
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(header)
+        f.write(np.ascontiguousarray(pcm, dtype="<i2").data)
+    
+    return pcm
+
+
+def _to_pcm16(samples: np.ndarray) -> np.ndarray:
+    """
+    Hard clip float samples to [-1, 1] and quantize to PCM-16.
+    
+    Note:
+        Same rule as libsndfile's float -> PCM_16 write path: round to
+        the nearest 32-bit integer (x * 2**31), then keep the high 16 bits
+        (floor of / 2**16). Output bytes are identical to sf.write() of the
+        clipped floats. Clip, scale and rounding run in place on a float64
+        tile (float32 -> float64 and the power-of-two scales are exact).
+        The tile is allocated per call and bounded by PCM16_TILE_SAMPLES,
+        so no N-sample float64 temporary is allocated and concurrent
+        writes (the two stems) share no scratch. The int16 output is
+        always fresh: write_wav() returns it to the caller.
+    """
+    pcm = np.empty(samples.shape, dtype=np.int16)
+    flat_in = samples.reshape(-1)
+    flat_out = pcm.reshape(-1)
+    
+    scratch = np.empty(min(flat_in.size, PCM16_TILE_SAMPLES), dtype=np.float64)
+    
+    for start in range(0, flat_in.size, PCM16_TILE_SAMPLES):
+        chunk = flat_in[start:start + PCM16_TILE_SAMPLES]
+        scaled = scratch[:chunk.size]
+        np.copyto(scaled, chunk)
+        np.clip(scaled, -1.0, 1.0, out=scaled)
+        np.multiply(scaled, 2147483648.0, out=scaled)
+        np.rint(scaled, out=scaled)
+        np.multiply(scaled, 1.0 / 65536.0, out=scaled)
+        np.floor(scaled, out=scaled)
+        # Only +1.0 maps past the int16 range (2**31 does not fit in int32)
+        np.minimum(scaled, 32767.0, out=scaled)
+        np.copyto(flat_out[start:start + chunk.size], scaled, casting="unsafe")
+    return pcm
+
+
+def _pcm16_wav_header(num_frames: int, channels: int, sample_rate: int) -> bytes:
+    """Build the canonical 44-byte PCM-16 RIFF/WAVE header."""
+    block_align = 2 * channels
+    data_size = num_frames * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b"data", data_size,
+    )
+
+
+def pcm16_to_float(pcm: np.ndarray) -> np.ndarray:
+    """
+    Decode PCM-16 samples to float32, exactly as read_wav() does.
+    
+    Args:
+        pcm: int16 samples (e.g. as returned by write_wav())
+    
+    Returns:
+        float32 samples in [-1, 1) (scale by 2**-15, exact)
+    """
+    return pcm.astype(np.float32) * PCM16_SCALE
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+
+
+FINITE_SCAN_CHUNK = 1 << 20  # Samples per all_finite() chunk
+
+
+def all_finite(samples: np.ndarray) -> bool:
+    """
+    Check that every sample is finite (no NaN or Inf).
+
+    Args:
+        samples: Audio samples (any shape)
+
+    Returns:
+        True if all samples are finite, False otherwise
+
+    Note:
+        Plain NumPy ufunc scan — no JIT, so there is no first-call
+        compilation cost on the ingest path. np.isfinite is SIMD-dispatched
+        from NumPy 1.24 (the pinned floor).
+        Long inputs are scanned in FINITE_SCAN_CHUNK blocks into one
+        boolean buffer allocated per call (never shared, so concurrent
+        calls are safe), so scratch memory stays bounded and the scan
+        stops at the first block containing a non-finite value.
+    """
+    flat = samples.reshape(-1)
+    if flat.size == 0:
+        return True
+
+    n = min(flat.size, FINITE_SCAN_CHUNK)
+    finite = np.empty(n, dtype=bool)
+
+    for start in range(0, flat.size, n):
+        chunk = flat[start:start + n]
+        out = finite[:chunk.size]
+        np.isfinite(chunk, out=out)
+        if not out.all():
+            return False
+
+    return True
 
 
 # =============================================================================
@@ -135,10 +326,10 @@ def normalize_audio(samples: np.ndarray, sample_rate: int) -> np.ndarray:
     """
     # Mono downmix if multi-channel
     if samples.ndim > 1:
-        samples = np.mean(samples, axis=1)
+        samples = _downmix_mono(samples)
     
-    # Ensure float32
-    samples = samples.astype(np.float32)
+    # Ensure float32 (no copy when already float32, e.g. from read_wav)
+    samples = samples.astype(np.float32, copy=False)
     
     # Resample to canonical rate if needed
     if sample_rate != CANONICAL_SAMPLE_RATE:
@@ -147,6 +338,37 @@ def normalize_audio(samples: np.ndarray, sample_rate: int) -> np.ndarray:
     return samples
 
 
+def _downmix_mono(samples: np.ndarray) -> np.ndarray:
+    """
+    Average the channels of (N, C) samples into a mono vector.
+    
+    Args:
+        samples: Multi-channel samples, shape (N, C)
+    
+    Returns:
+        Mono samples, shape (N,), identical to np.mean(samples, axis=1)
+    
+    Note:
+        np.mean over axis=1 reduces each C-element row separately, which is
+        slow for interleaved input. For float32/float64 input with fewer
+        than DOWNMIX_COLUMN_MAX_CHANNELS channels, the columns are
+        accumulated in channel order instead: for such short rows NumPy sums
+        sequentially, so the column-wise sum and the divide by C give the
+        same bits. That is NumPy behaviour, not API; tests/test_audio_io.py
+        pins it. Other dtypes (float16 accumulates in float32 in np.mean)
+        and wider input keep np.mean.
+    """
+    channels = samples.shape[1]
+    if channels >= DOWNMIX_COLUMN_MAX_CHANNELS or samples.dtype not in (np.float32, np.float64):
+        return np.mean(samples, axis=1)
+    
+    mono = samples[:, 0].copy()
+    for c in range(1, channels):
+        np.add(mono, samples[:, c], out=mono)
+    np.divide(mono, samples.dtype.type(channels), out=mono)
+    return mono
+
+
 def _resample_deterministic(samples: np.ndarray, sr_from: int, sr_to: int) -> np.ndarray:
     """
     Resample using scipy.signal.resample_poly with fixed integer factors.
@@ -161,7 +383,12 @@ def _resample_deterministic(samples: np.ndarray, sr_from: int, sr_to: int) -> np
     
     Note:
         Uses integer up/down factors for determinism.
+        scipy.signal is imported here rather than at module level: it
+        dominates the import cost of this module and is only needed for
+        inputs that are not already at the canonical rate.
     """
+    from scipy.signal import resample_poly
+    
     # Compute integer resampling factors
     g = gcd(sr_from, sr_to)
     up = sr_to // g
@@ -198,13 +425,25 @@ def compute_frame_rms(
     hop_samples = int(sr * hop_ms / 1000)
     
     n_frames = max(1, (len(samples) - frame_samples) // hop_samples + 1)
-    rms = np.zeros(n_frames, dtype=np.float32)
-    
-    for i in range(n_frames):
-        start = i * hop_samples
-        end = start + frame_samples
-        frame = samples[start:end]
-        rms[i] = np.sqrt(np.mean(frame ** 2) + EPS)
+    rms = np.empty(n_frames, dtype=np.float32)
+    
+    if len(samples) < frame_samples:
+        # Single partial frame
+        rms[0] = np.sqrt(np.mean(samples ** 2) + EPS)
+        return rms
+    
+    # Frames are processed in tiles of ~FRAME_TILE_SAMPLES input samples so
+    # the squared tile and its strided frame view stay cache-resident.
+    # Each frame is still reduced on its own (np.mean over a contiguous
+    # row), so values are bit-identical to a per-frame loop.
+    tile_frames = max(1, FRAME_TILE_SAMPLES // hop_samples)
+    for f0 in range(0, n_frames, tile_frames):
+        f1 = min(f0 + tile_frames, n_frames)
+        start = f0 * hop_samples
+        end = (f1 - 1) * hop_samples + frame_samples
+        squared = samples[start:end] ** 2
+        frames = sliding_window_view(squared, frame_samples)[::hop_samples]
+        np.sqrt(np.mean(frames, axis=1) + EPS, out=rms[f0:f1])
     
     return rms
 
@@ -225,7 +464,7 @@ def build_speech_mask(
         hop_ms: Hop length in milliseconds
     
     Returns:
-        Sample-level mask (1.0 = speech, 0.0 = non-speech)
+        Sample-level mask as uint8 (1 = speech, 0 = non-speech)
     
     Note:
         Threshold = max(global_rms * 0.5, EPS)
@@ -241,7 +480,7 @@ def build_speech_mask(
     threshold = max(global_rms * 0.5, EPS)
     
     # Frame-level mask
-    frame_mask = (frame_rms > threshold).astype(np.float32)
+    frame_mask = (frame_rms > threshold).astype(np.uint8)
     
     # Convert to sample mask
     return frame_mask_to_samples(frame_mask, len(samples), hop_ms, sr)
@@ -263,22 +502,59 @@ def frame_mask_to_samples(
         sr: Sample rate
     
     Returns:
-        Sample-level mask (1.0 or 0.0 per sample)
+        Sample-level mask as uint8 (1 or 0 per sample)
     
     Mapping rule (FROZEN):
         For sample i, use frame index = i // hop_samples
         Clamp to valid frame range.
     """
     hop_samples = int(sr * hop_ms / 1000)
-    sample_mask = np.zeros(num_samples, dtype=np.float32)
+    frame_mask = np.asarray(frame_mask).astype(np.uint8, copy=False)
+    sample_mask = np.empty(num_samples, dtype=np.uint8)
     
-    for i in range(num_samples):
-        frame_idx = min(i // hop_samples, len(frame_mask) - 1)
-        sample_mask[i] = frame_mask[frame_idx]
+    # Frames 0..n-1 each cover hop_samples samples; samples past the last
+    # frame's hop are clamped to the last frame.
+    n_mapped = min(num_samples, len(frame_mask) * hop_samples)
+    sample_mask[:n_mapped] = np.repeat(frame_mask, hop_samples)[:n_mapped]
+    sample_mask[n_mapped:] = frame_mask[-1]
     
     return sample_mask
 
 
+def split_stems(samples: np.ndarray, mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split samples into speech and residual stems using a sample mask.
+
+    Args:
+        samples: Input samples (1D, normalized)
+        mask: Sample-level speech mask, uint8 0/1 (same length as samples)
+
+    Returns:
+        Tuple of (speech, residual) where speech = samples * mask and
+        residual = samples - speech
+
+    Note:
+        The uint8 mask is read directly as the multiplier (cast in the
+        ufunc loop, no float mask or inverted mask is materialized), and
+        both stems are written into preallocated buffers with out=.
+        Measured faster than selecting each stem with np.where, which
+        reads the mask twice.
+        An all-speech or all-non-speech mask (pure silence, pure music)
+        skips the arithmetic: one stem is the input itself, the other is
+        zeros. The quantized stems are identical to the general path.
+    """
+    if not mask.any():
+        return np.zeros_like(samples), samples
+    if mask.all():
+        return samples, np.zeros_like(samples)
+    
+    speech = np.empty_like(samples)
+    residual = np.empty_like(samples)
+    np.multiply(samples, mask, out=speech)
+    np.subtract(samples, speech, out=residual)
+    return speech, residual
+
+
 # =============================================================================
 # Metrics Computation
 # =============================================================================
@@ -290,8 +566,14 @@ def compute_rms(samples: np.ndarray) -> float:
 
 
 def compute_peak_abs(samples: np.ndarray) -> float:
-    """Compute peak absolute value of signal."""
-    return float(np.max(np.abs(samples)))
+    """
+    Compute peak absolute value of signal.
+    
+    Note:
+        max(max, -min) equals max(|x|) without materializing an |x| array;
+        the outer abs() normalizes a -0.0 result for all-zero input.
+    """
+    return float(abs(max(samples.max(), -samples.min())))
 
 
 def compute_zero_crossing_rate(samples: np.ndarray) -> float:
@@ -304,9 +586,11 @@ def compute_zero_crossing_rate(samples: np.ndarray) -> float:
     if len(samples) < 2:
         return 0.0
     
-    # Count sign changes
-    signs = np.sign(samples)
-    crossings = np.sum(signs[1:] != signs[:-1])
+    # Count changes of sign class (-1, 0, +1; zero is its own class, as
+    # with np.sign). int8 signs from two comparisons use a quarter of the
+    # memory of float np.sign output; count_nonzero avoids a bool sum.
+    signs = (samples > 0).view(np.int8) - (samples < 0).view(np.int8)
+    crossings = np.count_nonzero(signs[1:] != signs[:-1])
     
     return float(crossings / (len(samples) - 1))
 
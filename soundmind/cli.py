@@ -117,6 +117,9 @@ def cmd_run(args: argparse.Namespace) -> int:
         return 1
     
     # Copy input file to input/original.wav
+    # A real copy, never a hardlink: the job's original must not alias the
+    # caller's file, or in-place edits to it would alter the job's evidence.
+    # copy2 already copies in-kernel (sendfile) on Linux.
     original_wav_path = paths["input_dir"] / "original.wav"
     shutil.copy2(input_path, original_wav_path)
     
@@ -179,10 +182,16 @@ def cmd_run(args: argparse.Namespace) -> int:
         return 1
 
 
-def main() -> None:
-    """Main entry point."""
+def main(argv: list[str] | None = None) -> None:
+    """
+    Main entry point.
+    
+    Args:
+        argv: Arguments excluding the program name (default: sys.argv[1:]).
+              Lets tests drive the CLI in-process.
+    """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.command is None:
         parser.print_help()
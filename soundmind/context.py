@@ -3,11 +3,13 @@ SoundMind v1 JobContext - Pipeline execution context.
 
 Responsibilities:
 - Hold all paths and configuration for a job
+- Hold the PCM of stems written during the current run (pcm_cache)
 - Serialization for debugging/logging
 
 Invariants:
-- Immutable during pipeline execution
+- Paths and configuration are immutable during pipeline execution
 - All paths are absolute
+- pcm_cache lives for one run: never serialized, cleared by run_pipeline()
 """
 
 from dataclasses import dataclass, field
@@ -26,6 +28,11 @@ class JobContext:
     input_json_path: Path
     stage_dirs: dict[str, Path] = field(default_factory=dict)
     run_config: dict[str, Any] = field(default_factory=dict)
+    # Stage B's stems as written (path -> (int16 PCM, sample_rate)), so later
+    # stages of the same run skip re-decoding them
+    pcm_cache: dict[Path, tuple[Any, int]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
     
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
@@ -57,19 +57,24 @@ def run_pipeline(ctx: JobContext) -> bool:
     Note:
         Overwrites the initialized job-level status.json from Commit 2.5.
         Commit 4: Includes aggregated artifacts from rollup.
+        ctx.pcm_cache is emptied when the run ends, even on error.
     """
     started_at = now_iso()
     failed_stage = None
     pipeline_errors: list[dict] = []
     
-    for stage_name, module_path in STAGE_ORDER:
-        try:
-            module = importlib.import_module(module_path)
-            ctx = module.run(ctx)
-        except StageFailure as e:
-            failed_stage = e.stage
-            pipeline_errors = e.errors
-            break
+    try:
+        for stage_name, module_path in STAGE_ORDER:
+            try:
+                module = importlib.import_module(module_path)
+                ctx = module.run(ctx)
+            except StageFailure as e:
+                failed_stage = e.stage
+                pipeline_errors = e.errors
+                break
+    finally:
+        # Stems cached for this run are not kept past it
+        ctx.pcm_cache.clear()
     
     completed_at = now_iso()
     success = failed_stage is None
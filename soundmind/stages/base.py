@@ -6,6 +6,7 @@ Responsibilities:
 - Error object builder per contract
 - Stage status.json writer
 - ArtifactRef dataclass for immutable artifact references
+- Stem readers that reuse PCM written earlier in the same run
 
 Invariants:
 - Stages always write status.json before raising StageFailure
@@ -13,11 +14,14 @@ Invariants:
 - ArtifactRef shape is FROZEN: path, type, role, description
 """
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from soundmind.utils import now_iso
+from soundmind.utils import now_iso, serialize_json
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 # =============================================================================
@@ -147,8 +151,7 @@ def write_stage_status(
         "errors": errors,
     }
     
-    status_path = stage_dir / "status.json"
-    status_path.write_text(json.dumps(status, indent=2, sort_keys=True) + "\n")
+    _write_status_file(stage_dir, status)
 
 
 def write_stage_status_v2(
@@ -209,8 +212,19 @@ def write_stage_status_v2(
         "errors": errors,
     }
     
-    status_path = stage_dir / "status.json"
-    status_path.write_text(json.dumps(status, indent=2, sort_keys=True) + "\n")
+    _write_status_file(stage_dir, status)
+
+
+def _write_status_file(stage_dir: Path, status: dict) -> None:
+    """
+    Write a stage's status.json in a single write.
+    
+    Note:
+        Shared by both status formats. Per-stage status.json files are part
+        of the frozen layout (rollup and the pipeline read them), so this
+        stays one small file per stage rather than a shared append log.
+    """
+    (stage_dir / "status.json").write_bytes(serialize_json(status).encode("utf-8"))
 
 
 # =============================================================================
@@ -266,9 +280,7 @@ def write_artifact(
         artifact_path.write_bytes(content)
     else:
         if isinstance(content, dict):
-            artifact_path.write_text(
-                json.dumps(content, indent=2, sort_keys=True) + "\n"
-            )
+            artifact_path.write_text(serialize_json(content))
         else:
             artifact_path.write_text(content)
     
@@ -306,3 +318,61 @@ def build_artifact_ref(
         description=description,
     )
 
+
+
+# =============================================================================
+# Stem Readers (run-scoped reuse)
+# =============================================================================
+
+
+def read_stem(
+    path: Path,
+    pcm_cache: dict[Path, tuple["np.ndarray", int]] | None = None,
+) -> tuple["np.ndarray", int]:
+    """
+    Read a stem as float32, from this run's PCM when available.
+    
+    Args:
+        path: Path to the stem WAV
+        pcm_cache: JobContext.pcm_cache of the current run, or None
+    
+    Returns:
+        Tuple of (samples as float32, sample_rate), equal to audio.read_wav(path)
+    
+    Note:
+        A hit decodes the PCM Stage B wrote (audio.pcm16_to_float), which
+        is exactly what reading the file back returns. Misses read the file.
+        soundmind.audio is imported here so that ingest and rollup, which
+        import this module, do not load numpy/soundfile.
+    """
+    from soundmind import audio
+    
+    cached = pcm_cache.get(path) if pcm_cache else None
+    if cached is None:
+        return audio.read_wav(path)
+    pcm, sr = cached
+    return audio.pcm16_to_float(pcm), sr
+
+
+def read_stem_int16(
+    path: Path,
+    pcm_cache: dict[Path, tuple["np.ndarray", int]] | None = None,
+) -> tuple["np.ndarray", int]:
+    """
+    Read a stem as int16, from this run's PCM when available.
+    
+    Args:
+        path: Path to the stem WAV
+        pcm_cache: JobContext.pcm_cache of the current run, or None
+    
+    Returns:
+        Tuple of (samples as int16, sample_rate), equal to
+        audio.read_wav_int16(path). A hit returns a copy.
+    """
+    from soundmind import audio
+    
+    cached = pcm_cache.get(path) if pcm_cache else None
+    if cached is None:
+        return audio.read_wav_int16(path)
+    pcm, sr = cached
+    return pcm.copy(), sr
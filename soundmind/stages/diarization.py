@@ -43,6 +43,7 @@ from soundmind.contracts import Stage, StageContract, StageContext
 from soundmind.stages.base import (
     ArtifactRef,
     build_artifact_ref,
+    read_stem,
     write_artifact,
     write_stage_status,
     write_stage_status_v2,
@@ -248,7 +249,7 @@ def run(ctx: JobContext) -> JobContext:
     
     # Load speech.wav (already masked by separation stage)
     speech_path = ctx.stage_dirs["separation"] / "stems" / "speech.wav"
-    samples, sr = audio.read_wav(speech_path)
+    samples, sr = read_stem(speech_path, ctx.pcm_cache)
     
     # Find contiguous non-zero regions (exact zero comparison)
     segments = find_speech_regions(samples, sr)
@@ -51,6 +51,8 @@ from soundmind.stages.base import (
     ArtifactRef,
     build_artifact_ref,
     ensure_artifact_path,
+    read_stem,
+    read_stem_int16,
     write_stage_status,
     write_stage_status_v2,
 )
@@ -253,7 +255,7 @@ def _serialize_events_json(events_data):
 # =============================================================================
 
 
-def _compute_events(separation_dir):
+def _compute_events(separation_dir, pcm_cache=None):
     """Compute events data from separation outputs.
 
     Reads speech.wav (int16 for exact-zero mask) and residual.wav (float32)
@@ -262,20 +264,22 @@ def _compute_events(separation_dir):
     Args:
         separation_dir: Path to separation stage directory
             (contains stems/speech.wav and stems/residual.wav)
+        pcm_cache: JobContext.pcm_cache of the current run, or None to
+            read both stems from disk
 
     Returns:
         dict with "events" key containing list of event dicts.
     """
     # Read speech.wav as raw int16 for exact-zero comparison (Commit 9)
     speech_path = separation_dir / "stems" / "speech.wav"
-    speech_int16, sr = audio.read_wav_int16(speech_path)
+    speech_int16, sr = read_stem_int16(speech_path, pcm_cache)
 
     # Build non-speech mask from raw integer samples
     non_speech_mask = _build_non_speech_mask_from_int16(speech_int16)
 
     # Load residual stem as float32 for impulse detection
     residual_path = separation_dir / "stems" / "residual.wav"
-    residual_samples, _ = audio.read_wav(residual_path)
+    residual_samples, _ = read_stem(residual_path, pcm_cache)
 
     # Detect impulses in non-speech regions of residual
     events = _detect_impulses_non_speech_only(
@@ -381,7 +385,7 @@ def run(ctx: JobContext) -> JobContext:
 
     # Compute events via shared logic
     separation_dir = ctx.stage_dirs["separation"]
-    events_data = _compute_events(separation_dir)
+    events_data = _compute_events(separation_dir, ctx.pcm_cache)
 
     # Write deterministic JSON
     artifact_path = _write_events_json(stage_dir, events_data)
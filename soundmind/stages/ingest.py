@@ -20,6 +20,8 @@ Commit 6: Adds validation that input is a readable WAV with finite values.
     - No artifacts written (Stage A remains "validation only")
 """
 
+from pathlib import Path
+
 from soundmind.context import JobContext
 from soundmind.contracts import Stage, StageContract, StageContext
 from soundmind.stages.base import (
@@ -44,6 +46,10 @@ CONTRACT = StageContract(
     version="1.0.0",
 )
 
+# RIFF container magics accepted ahead of the WAVE form type
+# (little-endian, big-endian, and 64-bit WAV)
+RIFF_MAGICS = (b"RIFF", b"RIFX", b"RF64")
+
 
 # =============================================================================
 # IngestStage Class (Commit 5 + Commit 6 validation)
@@ -78,15 +84,9 @@ class IngestStage(Stage):
         start_time = now_iso()
         stage_dir = ctx.workspace / "ingest"
         
-        # Validate input exists
-        if not ctx.input_audio.exists():
-            error = build_error(
-                code="INGEST_INPUT_MISSING",
-                message="original.wav not found in input directory",
-                stage="ingest",
-                detail={"expected_path": str(ctx.input_audio)},
-            )
-            # Write status before raising
+        # One failure decision, one status write, one raise
+        error = _check_input(ctx.input_audio)
+        if error is not None:
             write_stage_status_v2(
                 stage_dir=stage_dir,
                 stage_name=self.contract.name,
@@ -99,21 +99,6 @@ class IngestStage(Stage):
             )
             raise StageFailure("ingest", [error])
         
-        # Commit 6: Validate audio is readable and has finite values
-        validation_error = self._validate_audio(ctx.input_audio)
-        if validation_error:
-            write_stage_status_v2(
-                stage_dir=stage_dir,
-                stage_name=self.contract.name,
-                stage_version=self.contract.version,
-                start_time=start_time,
-                input_artifacts=[],
-                output_artifacts=[],
-                success=False,
-                errors=[validation_error],
-            )
-            raise StageFailure("ingest", [validation_error])
-        
         # Produce audio/original artifact
         # Note: References canonical input path, no duplication
         artifact = build_artifact_ref(
@@ -134,115 +119,105 @@ class IngestStage(Stage):
         )
         
         return [artifact]
-    
-    def _validate_audio(self, path) -> dict | None:
-        """
-        Validate that audio file is readable and has finite values.
-        
-        Returns:
-            Error dict if validation fails, None if valid.
-        """
-        try:
-            import numpy as np
-            from soundmind.audio import read_wav
-            
-            samples, sr = read_wav(path)
-            
-            # Check for empty audio
-            if len(samples) == 0:
-                return build_error(
-                    code="INGEST_EMPTY_AUDIO",
-                    message="Audio file is empty",
-                    stage="ingest",
-                    detail={"path": str(path)},
-                )
-            
-            # Check for non-finite values
-            if not np.all(np.isfinite(samples)):
-                return build_error(
-                    code="INGEST_INVALID_AUDIO",
-                    message="Audio file contains non-finite values (NaN or Inf)",
-                    stage="ingest",
-                    detail={"path": str(path)},
-                )
-            
-            return None
-            
-        except Exception as e:
-            return build_error(
-                code="INGEST_READ_ERROR",
-                message=f"Failed to read audio file: {e}",
-                stage="ingest",
-                detail={"path": str(path), "error": str(e)},
-            )
 
 
 # =============================================================================
-# Backward-Compatible Adapter (TEMPORARY — remove in Commit 6/7)
+# Input Validation (shared by IngestStage and adapter)
 # =============================================================================
 
 
-def run(ctx: JobContext) -> JobContext:
+def _check_input(path: Path) -> dict | None:
     """
-    Stage A: Verify input exists.
-    
-    TEMPORARY ADAPTER: Delegates to IngestStage.run() internally.
-    This adapter exists only to avoid breaking current pipeline wiring.
-    Will be removed when pipeline switches to Stage-based execution.
+    Check that the input exists and is valid audio. Never raises.
     
-    Checks that input/original.wav exists in the workspace.
-    Writes ingest/status.json.
-    Raises StageFailure if input is missing.
+    Returns:
+        Error dict if the input is missing or invalid, None if valid.
     """
-    started_at = now_iso()
-    stage_dir = ctx.stage_dirs["ingest"]
-    
-    if not ctx.input_wav_path.exists():
-        error = build_error(
+    if not path.exists():
+        return build_error(
             code="INGEST_INPUT_MISSING",
             message="original.wav not found in input directory",
             stage="ingest",
-            detail={"expected_path": str(ctx.input_wav_path)},
+            detail={"expected_path": str(path)},
         )
-        write_stage_status(stage_dir, ctx.job_id, "ingest", False, started_at, errors=[error])
-        raise StageFailure("ingest", [error])
+    return _validate_audio(path)
+
+
+def _validate_audio(path: Path) -> dict | None:
+    """
+    Validate that audio file is readable and has finite values.
     
-    # Commit 6: Validate audio
+    Returns:
+        Error dict if validation fails, None if valid.
+    """
     try:
-        import numpy as np
-        from soundmind.audio import read_wav
-        
-        samples, sr = read_wav(ctx.input_wav_path)
+        from soundmind.audio import all_finite, read_wav
+
+        # Reject non-WAV input from the 12-byte header, before any decode
+        with open(path, "rb") as f:
+            header = f.read(12)
+        if header[:4] not in RIFF_MAGICS or header[8:12] != b"WAVE":
+            return build_error(
+                code="INGEST_INVALID_AUDIO",
+                message="Audio file is not a RIFF/WAVE file",
+                stage="ingest",
+                detail={"path": str(path), "reason": "not a RIFF/WAVE file"},
+            )
+
+        samples, sr = read_wav(path)
         
+        # Check for empty audio
         if len(samples) == 0:
-            error = build_error(
+            return build_error(
                 code="INGEST_EMPTY_AUDIO",
                 message="Audio file is empty",
                 stage="ingest",
-                detail={"path": str(ctx.input_wav_path)},
+                detail={"path": str(path)},
             )
-            write_stage_status(stage_dir, ctx.job_id, "ingest", False, started_at, errors=[error])
-            raise StageFailure("ingest", [error])
         
-        if not np.all(np.isfinite(samples)):
-            error = build_error(
+        # Check for non-finite values
+        if not all_finite(samples):
+            return build_error(
                 code="INGEST_INVALID_AUDIO",
-                message="Audio file contains non-finite values",
+                message="Audio file contains non-finite values (NaN or Inf)",
                 stage="ingest",
-                detail={"path": str(ctx.input_wav_path)},
+                detail={"path": str(path)},
             )
-            write_stage_status(stage_dir, ctx.job_id, "ingest", False, started_at, errors=[error])
-            raise StageFailure("ingest", [error])
-            
-    except StageFailure:
-        raise
+        
+        return None
+    
     except Exception as e:
-        error = build_error(
+        return build_error(
             code="INGEST_READ_ERROR",
             message=f"Failed to read audio file: {e}",
             stage="ingest",
-            detail={"path": str(ctx.input_wav_path), "error": str(e)},
+            detail={"path": str(path), "error": str(e)},
         )
+
+
+# =============================================================================
+# Backward-Compatible Adapter (TEMPORARY — remove in Commit 6/7)
+# =============================================================================
+
+
+def run(ctx: JobContext) -> JobContext:
+    """
+    Stage A: Verify input exists.
+    
+    TEMPORARY ADAPTER: Delegates to IngestStage.run() internally.
+    This adapter exists only to avoid breaking current pipeline wiring.
+    Will be removed when pipeline switches to Stage-based execution.
+    
+    Checks that input/original.wav exists in the workspace.
+    Writes ingest/status.json.
+    Raises StageFailure if input is missing.
+    """
+    started_at = now_iso()
+    stage_dir = ctx.stage_dirs["ingest"]
+    
+    # Commit 6: Validate audio (same checks as IngestStage)
+    error = _check_input(ctx.input_wav_path)
+    if error is not None:
         write_stage_status(stage_dir, ctx.job_id, "ingest", False, started_at, errors=[error])
         raise StageFailure("ingest", [error])
     
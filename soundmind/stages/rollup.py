@@ -24,6 +24,7 @@ Commit 5: Implements Stage class with contract.
 """
 
 import json
+from pathlib import Path
 
 from soundmind.context import JobContext
 from soundmind.contracts import Stage, StageContract, StageContext
@@ -58,6 +59,13 @@ CONTRACT = StageContract(
 EXPECTED_STAGES = ["ingest", "separation", "sqi", "diarization", "events"]
 
 
+def _read_status_or_none(status_path: Path) -> dict | None:
+    """Read a stage status.json, or return None if the stage wrote none."""
+    if not status_path.exists():
+        return None
+    return json.loads(status_path.read_text())
+
+
 # =============================================================================
 # RollupStage Class (Commit 5)
 # =============================================================================
@@ -90,20 +98,16 @@ class RollupStage(Stage):
         # All input artifacts from prior stages
         input_artifacts = list(ctx.artifacts)
         
-        # Read all prior stage statuses for compatibility with existing code
-        stage_statuses = {}
+        # Single pass over prior stage statuses: missing stage = failure
+        missing = []
+        all_success = True
         for stage_name in EXPECTED_STAGES:
-            status_path = ctx.workspace / stage_name / "status.json"
-            if status_path.exists():
-                stage_statuses[stage_name] = json.loads(status_path.read_text())
-        
-        # Check for missing stages
-        missing = [s for s in EXPECTED_STAGES if s not in stage_statuses]
-        
-        if missing:
-            all_success = False
-        else:
-            all_success = all(s.get("success", False) for s in stage_statuses.values())
+            status = _read_status_or_none(ctx.workspace / stage_name / "status.json")
+            if status is None:
+                missing.append(stage_name)
+                all_success = False
+                continue
+            all_success = all_success and bool(status.get("success", False))
         
         # Write enhanced status
         write_stage_status_v2(
@@ -137,30 +141,22 @@ def run(ctx: JobContext) -> JobContext:
     """
     started_at = now_iso()
     
-    # Read all prior stage statuses
-    stage_statuses = {}
-    for stage_name in EXPECTED_STAGES:
-        status_path = ctx.stage_dirs[stage_name] / "status.json"
-        if status_path.exists():
-            stage_statuses[stage_name] = json.loads(status_path.read_text())
-    
-    # Check for missing stages (explicit, not silent)
-    missing = [s for s in EXPECTED_STAGES if s not in stage_statuses]
-    
-    if missing:
-        # Missing stages = failure (stage didn't produce status.json)
-        all_success = False
-    else:
-        # All stages must have succeeded
-        all_success = all(s.get("success", False) for s in stage_statuses.values())
-    
-    # Aggregate artifacts from all stages in stage order
+    # Single pass: read each prior status, track missing stages (explicit,
+    # not silent), and aggregate artifacts in stage order.
     # Preserve per-stage order, do NOT rewrite refs
+    missing = []
+    all_success = True
     aggregated_artifacts = []
     for stage_name in EXPECTED_STAGES:
-        if stage_name in stage_statuses:
-            stage_artifacts = stage_statuses[stage_name].get("artifacts", [])
-            aggregated_artifacts.extend(stage_artifacts)
+        status = _read_status_or_none(ctx.stage_dirs[stage_name] / "status.json")
+        if status is None:
+            # Missing stage = failure (stage didn't produce status.json)
+            missing.append(stage_name)
+            all_success = False
+            continue
+        # All stages must have succeeded
+        all_success = all_success and bool(status.get("success", False))
+        aggregated_artifacts.extend(status.get("artifacts", []))
     
     # Rollup records result but never raises — it's an observer
     write_stage_status(
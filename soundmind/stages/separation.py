@@ -22,6 +22,9 @@ Commit 6: Real energy-based RMS masking.
     - Same length, sample rate, deterministic output
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import numpy as np
 
 from soundmind import audio
@@ -49,6 +52,33 @@ CONTRACT = StageContract(
 )
 
 
+# =============================================================================
+# Stem Output (shared by SeparationStage and adapter)
+# =============================================================================
+
+
+def _write_stems(
+    speech_path: Path,
+    speech: np.ndarray,
+    residual_path: Path,
+    residual: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Write the speech and residual stems concurrently.
+    
+    The two files are independent, so the writes overlap on a 2-worker
+    pool. Each file's bytes are unaffected by the ordering; both results
+    are awaited so any write error propagates.
+    
+    Returns:
+        The int16 PCM written for (speech, residual)
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        speech_future = pool.submit(audio.write_wav, speech_path, speech)
+        residual_future = pool.submit(audio.write_wav, residual_path, residual)
+        return speech_future.result(), residual_future.result()
+
+
 # =============================================================================
 # SeparationStage Class (Commit 6 — Real Implementation)
 # =============================================================================
@@ -88,17 +118,15 @@ class SeparationStage(Stage):
         # Build speech mask using energy-based RMS thresholding
         mask = audio.build_speech_mask(samples, sr=audio.CANONICAL_SAMPLE_RATE)
         
-        # Create stems
-        speech = samples * mask
-        residual = samples - speech  # = samples * (1 - mask)
+        # Create stems (speech = samples * mask, residual = samples - speech)
+        speech, residual = audio.split_stems(samples, mask)
         
         # Prepare output paths
         speech_path = ensure_artifact_path(stage_dir, "stems/speech.wav")
         residual_path = ensure_artifact_path(stage_dir, "stems/residual.wav")
         
         # Write with hard clipping (already handled in write_wav)
-        audio.write_wav(speech_path, speech)
-        audio.write_wav(residual_path, residual)
+        _write_stems(speech_path, speech, residual_path, residual)
         
         # Build artifact refs
         artifacts = [
@@ -155,16 +183,16 @@ def run(ctx: JobContext) -> JobContext:
     mask = audio.build_speech_mask(samples, sr=audio.CANONICAL_SAMPLE_RATE)
     
     # Create stems
-    speech = samples * mask
-    residual = samples - speech
+    speech, residual = audio.split_stems(samples, mask)
     
     # Prepare output paths
     speech_path = ensure_artifact_path(stage_dir, "stems/speech.wav")
     residual_path = ensure_artifact_path(stage_dir, "stems/residual.wav")
     
-    # Write WAVs
-    audio.write_wav(speech_path, speech)
-    audio.write_wav(residual_path, residual)
+    # Write WAVs; keep the written PCM so Stages C-E of this run skip the decode
+    speech_pcm, residual_pcm = _write_stems(speech_path, speech, residual_path, residual)
+    ctx.pcm_cache[speech_path] = (speech_pcm, audio.CANONICAL_SAMPLE_RATE)
+    ctx.pcm_cache[residual_path] = (residual_pcm, audio.CANONICAL_SAMPLE_RATE)
     
     # Build artifact refs
     artifacts = [
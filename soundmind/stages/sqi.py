@@ -25,6 +25,8 @@ Commit 6: Real metrics computation.
     - Computes all 7 locked metrics deterministically
 """
 
+from pathlib import Path
+
 import numpy as np
 
 from soundmind import audio
@@ -32,7 +34,10 @@ from soundmind.context import JobContext
 from soundmind.contracts import Stage, StageContract, StageContext
 from soundmind.stages.base import (
     ArtifactRef,
+    StageFailure,
     build_artifact_ref,
+    build_error,
+    read_stem,
     write_artifact,
     write_stage_status,
     write_stage_status_v2,
@@ -52,6 +57,70 @@ CONTRACT = StageContract(
 )
 
 
+# =============================================================================
+# Metrics (shared by SqiStage and adapter)
+# =============================================================================
+
+
+def _check_stem(path: Path, samples: np.ndarray, sr: int) -> dict | None:
+    """
+    Check that the speech stem is canonical (mono, 16kHz).
+    
+    Returns:
+        Error dict if it is not, None if it is.
+    
+    Note:
+        The stem is not renormalized, and the metrics take the canonical
+        rate as given, so a non-canonical stem fails the stage rather
+        than yielding wrong duration_sec / sample_rate_hz.
+    """
+    if sr == audio.CANONICAL_SAMPLE_RATE and samples.ndim == 1:
+        return None
+    return build_error(
+        code="SQI_NON_CANONICAL_STEM",
+        message="Speech stem is not canonical (mono, 16kHz)",
+        stage="sqi",
+        detail={
+            "path": str(path),
+            "sample_rate": sr,
+            "channels": 1 if samples.ndim == 1 else int(samples.shape[1]),
+        },
+    )
+
+
+def _compute_metrics(samples: np.ndarray) -> dict:
+    """
+    Compute the 7 locked SQI metrics for the speech stem.
+    
+    Args:
+        samples: Normalized speech stem samples (mono, 16kHz, float32)
+    
+    Returns:
+        Metrics dict (key order irrelevant; serialized with sort_keys)
+    
+    Note:
+        Each reduction keeps its original float32 NumPy form. A fused
+        single-pass loop would change the summation order of rms and
+        so its bits.
+    """
+    # Compute speech ratio (recomputed locally, same method as Stage B).
+    # Not reused from Stage B: this mask is built over the speech stem,
+    # whose global RMS (and so threshold) differs from the input's, so
+    # Stage B's mask would yield a different speech_ratio.
+    mask = audio.build_speech_mask(samples, sr=audio.CANONICAL_SAMPLE_RATE)
+    speech_ratio = float(np.mean(mask.astype(np.float32)))
+    
+    return {
+        "duration_sec": float(len(samples) / audio.CANONICAL_SAMPLE_RATE),
+        "num_samples": int(len(samples)),
+        "peak_abs": audio.compute_peak_abs(samples),
+        "rms": audio.compute_rms(samples),
+        "sample_rate_hz": audio.CANONICAL_SAMPLE_RATE,
+        "speech_ratio": speech_ratio,
+        "zero_crossing_rate": audio.compute_zero_crossing_rate(samples),
+    }
+
+
 # =============================================================================
 # SqiStage Class (Commit 6 — Real Implementation)
 # =============================================================================
@@ -75,6 +144,9 @@ class SqiStage(Stage):
         
         Returns:
             List containing single metadata/sqi artifact reference.
+        
+        Raises:
+            StageFailure: If the speech stem is not mono 16kHz.
         """
         start_time = now_iso()
         stage_dir = ctx.workspace / "sqi"
@@ -84,25 +156,25 @@ class SqiStage(Stage):
         
         # Find speech artifact and load it
         speech_path = ctx.workspace / "separation" / "stems" / "speech.wav"
+        # Stage B wrote the stem in canonical form (mono, 16kHz, float32
+        # on read), so no renormalization pass is needed; checked, not assumed
         samples, sr = audio.read_wav(speech_path)
-        samples = audio.normalize_audio(samples, sr)
-        
-        # Compute speech ratio (recomputed locally, same method as Stage B)
-        mask = audio.build_speech_mask(samples, sr=audio.CANONICAL_SAMPLE_RATE)
-        speech_ratio = float(np.mean(mask))
+        error = _check_stem(speech_path, samples, sr)
+        if error is not None:
+            write_stage_status_v2(
+                stage_dir=stage_dir,
+                stage_name=self.contract.name,
+                stage_version=self.contract.version,
+                start_time=start_time,
+                input_artifacts=list(input_artifacts),
+                output_artifacts=[],
+                success=False,
+                errors=[error],
+            )
+            raise StageFailure("sqi", [error])
         
         # Compute metrics (locked set, deterministic order via sort_keys)
-        sqi_data = {
-            "metrics": {
-                "duration_sec": float(len(samples) / audio.CANONICAL_SAMPLE_RATE),
-                "num_samples": int(len(samples)),
-                "peak_abs": audio.compute_peak_abs(samples),
-                "rms": audio.compute_rms(samples),
-                "sample_rate_hz": audio.CANONICAL_SAMPLE_RATE,
-                "speech_ratio": speech_ratio,
-                "zero_crossing_rate": audio.compute_zero_crossing_rate(samples),
-            }
-        }
+        sqi_data = {"metrics": _compute_metrics(samples)}
         
         # Write JSON (sort_keys=True is handled by write_artifact)
         artifact_path = write_artifact(stage_dir, "sqi.json", sqi_data)
@@ -140,31 +212,21 @@ def run(ctx: JobContext) -> JobContext:
     TEMPORARY ADAPTER: Maintains backward compatibility with pipeline.
     
     Commit 6: Real metrics computation with locked set.
+    Raises StageFailure if the speech stem is not mono 16kHz.
     """
     started_at = now_iso()
     stage_dir = ctx.stage_dirs["sqi"]
     
     # Load speech stem
     speech_path = ctx.stage_dirs["separation"] / "stems" / "speech.wav"
-    samples, sr = audio.read_wav(speech_path)
-    samples = audio.normalize_audio(samples, sr)
-    
-    # Compute speech ratio (recomputed locally)
-    mask = audio.build_speech_mask(samples, sr=audio.CANONICAL_SAMPLE_RATE)
-    speech_ratio = float(np.mean(mask))
+    samples, sr = read_stem(speech_path, ctx.pcm_cache)  # already canonical (Stage B)
+    error = _check_stem(speech_path, samples, sr)
+    if error is not None:
+        write_stage_status(stage_dir, ctx.job_id, "sqi", False, started_at, errors=[error])
+        raise StageFailure("sqi", [error])
     
     # Compute metrics (locked set)
-    sqi_data = {
-        "metrics": {
-            "duration_sec": float(len(samples) / audio.CANONICAL_SAMPLE_RATE),
-            "num_samples": int(len(samples)),
-            "peak_abs": audio.compute_peak_abs(samples),
-            "rms": audio.compute_rms(samples),
-            "sample_rate_hz": audio.CANONICAL_SAMPLE_RATE,
-            "speech_ratio": speech_ratio,
-            "zero_crossing_rate": audio.compute_zero_crossing_rate(samples),
-        }
-    }
+    sqi_data = {"metrics": _compute_metrics(samples)}
     
     # Write JSON
     artifact_path = write_artifact(stage_dir, "sqi.json", sqi_data)
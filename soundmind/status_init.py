@@ -13,9 +13,12 @@ Forbidden:
 
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from soundmind.utils import serialize_json
+
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "status.schema.json"
 
@@ -55,16 +58,11 @@ def validate_status(status: dict[str, Any]) -> list[str]:
     Returns:
         List of validation error messages (empty if valid).
     """
-    try:
-        import jsonschema
-    except ImportError:
+    validator = _status_validator()
+    if validator is None:
         # If jsonschema not available, skip validation
         return []
     
-    with open(SCHEMA_PATH) as f:
-        schema = json.load(f)
-    
-    validator = jsonschema.Draft7Validator(schema)
     errors = []
     for error in validator.iter_errors(status):
         path = ".".join(str(p) for p in error.absolute_path) or "(root)"
@@ -72,6 +70,25 @@ def validate_status(status: dict[str, Any]) -> list[str]:
     return errors
 
 
+@lru_cache(maxsize=1)
+def _status_validator():
+    """
+    Load the status schema and build its validator once per process.
+    
+    Returns:
+        jsonschema.Draft7Validator, or None if jsonschema is not installed.
+    """
+    try:
+        import jsonschema
+    except ImportError:
+        return None
+    
+    with open(SCHEMA_PATH) as f:
+        schema = json.load(f)
+    
+    return jsonschema.Draft7Validator(schema)
+
+
 def serialize_status(status: dict[str, Any]) -> str:
     """
     Serialize status to JSON deterministically.
@@ -82,4 +99,4 @@ def serialize_status(status: dict[str, Any]) -> str:
     Returns:
         JSON string with sorted keys and consistent formatting.
     """
-    return json.dumps(status, indent=2, sort_keys=True) + "\n"
+    return serialize_json(status)
@@ -18,6 +18,10 @@ from typing import Any, Mapping
 # Explicit PST timezone (no DST, fixed -08:00)
 PST = timezone(timedelta(hours=-8))
 
+# Shared encoder: same settings as json.dumps(indent=2, sort_keys=True),
+# built once instead of per call.
+_JSON_ENCODER = json.JSONEncoder(indent=2, sort_keys=True)
+
 
 def now_iso() -> str:
     """
@@ -38,5 +42,10 @@ def serialize_json(data: Mapping[str, Any]) -> str:
     
     Returns:
         JSON string with sorted keys, 2-space indent, trailing newline.
+    
+    Note:
+        Single serializer for status and artifact JSON. Deliberately stdlib:
+        orjson formats floats and non-ASCII differently (0.00001 vs 1e-05,
+        raw UTF-8 vs \\u escapes), which would change frozen outputs.
     """
-    return json.dumps(data, indent=2, sort_keys=True) + "\n"
+    return _JSON_ENCODER.encode(data) + "\n"
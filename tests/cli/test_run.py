@@ -1,7 +1,9 @@
 """
 SoundMind v1 CLI Tests
 
-Black-box subprocess tests only. No imports from soundmind.cli.
+Black-box CLI tests driven in-process through tests.conftest.run_cli
+(argv in; exit code, stdout and stderr out). Import-isolation guarantees
+run in a fresh subprocess interpreter.
 
 Updated for Commit 2.5+ CLI contract:
 - --input is required
@@ -9,31 +11,48 @@ Updated for Commit 2.5+ CLI contract:
 - status.json reflects pipeline completion
 """
 
-import json
+import filecmp
+import os
 import subprocess
 import sys
-from pathlib import Path
 
 import pytest
 
-
-def run_cli(*args: str, cwd: str | None = None) -> subprocess.CompletedProcess:
-    """Run soundmind CLI as subprocess."""
-    return subprocess.run(
-        [sys.executable, "-m", "soundmind", *args],
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-    )
+from tests.conftest import read_json, run_cli
 
 
 @pytest.fixture
-def input_file(tmp_path):
+def input_file(tmp_path, test_wav_factory):
     """Create a valid test WAV file for testing."""
-    from tests.conftest import create_test_wav
-    input_path = tmp_path / "test_input.wav"
-    create_test_wav(input_path, duration_sec=0.5)  # Short for faster tests
-    return input_path
+    # Short for faster tests
+    return test_wav_factory(tmp_path / "test_input.wav", duration_sec=0.5)
+
+
+@pytest.fixture(scope="module")
+def completed_job(tmp_path_factory, test_wav_factory):
+    """
+    Run the CLI once per module and return the finished job.
+    
+    Shared by the tests that only inspect a successful run's layout and
+    status; tests that need their own flags or job IDs call run_cli.
+    Tests must treat the job directory as read-only.
+    """
+    root = tmp_path_factory.mktemp("cli_job")
+    input_path = test_wav_factory(root / "test_input.wav", duration_sec=0.5)
+    job_id = "cli-shared-job"
+    jobs_root = root / "jobs"
+    result = run_cli(
+        "run",
+        "--input", str(input_path),
+        "--jobs-root", str(jobs_root),
+        "--job-id", job_id,
+    )
+    return {
+        "job_id": job_id,
+        "job_dir": jobs_root / job_id,
+        "input_file": input_path,
+        "result": result,
+    }
 
 
 class TestHelpText:
@@ -46,6 +65,16 @@ class TestHelpText:
         assert "{run}" in result.stdout
         assert "Initialize a new SoundMind job workspace." in result.stdout
 
+    def test_module_entrypoint(self):
+        """`python -m soundmind` dispatches to the CLI (real interpreter)."""
+        result = subprocess.run(
+            [sys.executable, "-m", "soundmind", "--help"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert "SoundMind v1 command-line interface." in result.stdout
+
     def test_run_help(self):
         result = run_cli("run", "--help")
         assert result.returncode == 0
@@ -70,9 +99,10 @@ class TestRunCommand:
         assert result.returncode == 0
 
         # Should have created exactly one job directory
-        job_dirs = list(jobs_root.iterdir())
-        assert len(job_dirs) == 1
-        assert job_dirs[0].is_dir()
+        with os.scandir(jobs_root) as it:
+            entries = list(it)
+        assert len(entries) == 1
+        assert entries[0].is_dir()
 
     def test_run_respects_job_id(self, tmp_path, input_file):
         """--job-id is respected."""
@@ -132,72 +162,54 @@ class TestRunCommand:
         assert result.returncode != 0
         assert "not found" in result.stderr.lower() or "error" in result.stderr.lower()
 
+    def test_run_rejects_non_wav_input(self, tmp_path):
+        """Non-RIFF/WAVE input fails ingest as invalid audio."""
+        bogus = tmp_path / "not_audio.wav"
+        bogus.write_bytes(b"ID3\x04" + b"\x00" * 64)
+        jobs_root = tmp_path / "jobs"
+        result = run_cli(
+            "run",
+            "--input", str(bogus),
+            "--jobs-root", str(jobs_root),
+            "--job-id", "non-wav-job",
+        )
+        assert result.returncode != 0
+
+        ingest_status = read_json(jobs_root / "non-wav-job" / "ingest" / "status.json")
+        assert ingest_status["success"] is False
+        assert ingest_status["errors"][0]["code"] == "INGEST_INVALID_AUDIO"
+
 
 class TestStatusJson:
     """Test status.json creation after pipeline run."""
 
-    def test_status_json_exists(self, tmp_path, input_file):
+    def test_status_json_exists(self, completed_job):
         """status.json exists in job directory."""
-        job_id = "status-test-job"
-        jobs_root = tmp_path / "jobs"
-        run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        
-        status_path = jobs_root / job_id / "status.json"
+        status_path = completed_job["job_dir"] / "status.json"
         assert status_path.exists()
 
-    def test_status_json_has_job_id(self, tmp_path, input_file):
+    def test_status_json_has_job_id(self, completed_job):
         """status.json contains correct job_id."""
-        job_id = "shape-test-job"
-        jobs_root = tmp_path / "jobs"
-        run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        
-        status_path = jobs_root / job_id / "status.json"
-        status = json.loads(status_path.read_text())
+        status_path = completed_job["job_dir"] / "status.json"
+        status = read_json(status_path)
         
-        assert status["job_id"] == job_id
+        assert status["job_id"] == completed_job["job_id"]
         assert status["version"] == "v1"
 
-    def test_status_json_has_success(self, tmp_path, input_file):
+    def test_status_json_has_success(self, completed_job):
         """status.json indicates pipeline success."""
-        job_id = "success-test-job"
-        jobs_root = tmp_path / "jobs"
-        result = run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        assert result.returncode == 0
+        assert completed_job["result"].returncode == 0
         
-        status_path = jobs_root / job_id / "status.json"
-        status = json.loads(status_path.read_text())
+        status_path = completed_job["job_dir"] / "status.json"
+        status = read_json(status_path)
         
         assert status["success"] is True
         assert status["failed_stage"] is None
 
-    def test_status_json_has_stages(self, tmp_path, input_file):
+    def test_status_json_has_stages(self, completed_job):
         """status.json contains stage status references."""
-        job_id = "stages-test-job"
-        jobs_root = tmp_path / "jobs"
-        run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        
-        status_path = jobs_root / job_id / "status.json"
-        status = json.loads(status_path.read_text())
+        status_path = completed_job["job_dir"] / "status.json"
+        status = read_json(status_path)
         
         # Pipeline runs all stages
         expected_stages = ["ingest", "separation", "sqi", "diarization", "events", "rollup"]
@@ -251,67 +263,51 @@ class TestDryRun:
         assert str(input_file) in result.stdout or input_file.name in result.stdout
 
 
+@pytest.fixture(scope="module")
+def cli_import_probe() -> list[str]:
+    """
+    soundmind modules loaded by a clean interpreter after importing the CLI.
+    
+    One fresh subprocess serves every import-isolation test.
+    """
+    result = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys; import soundmind.cli; "
+            "print('\\n'.join(sorted(k for k in sys.modules if k.startswith('soundmind'))))"
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()
+
+
 class TestNegativeGuarantees:
     """Test negative guarantees - what must NOT happen."""
 
-    def test_no_stage_modules_imported_at_parse_time(self):
+    def test_no_stage_modules_imported_at_parse_time(self, cli_import_probe):
         """No stage modules imported during CLI module load."""
-        result = subprocess.run(
-            [
-                sys.executable, "-c",
-                "import sys; import soundmind.cli; "
-                "stage_modules = [k for k in sys.modules if 'soundmind.stages' in k]; "
-                "print(','.join(stage_modules) if stage_modules else 'NONE')"
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "NONE", f"Stage modules imported: {result.stdout}"
+        stage_modules = [k for k in cli_import_probe if "soundmind.stages" in k]
+        assert not stage_modules, f"Stage modules imported: {stage_modules}"
 
-    def test_no_pipeline_imported_at_parse_time(self):
+    def test_no_pipeline_imported_at_parse_time(self, cli_import_probe):
         """soundmind.pipeline not imported during CLI module load."""
-        result = subprocess.run(
-            [
-                sys.executable, "-c",
-                "import sys; import soundmind.cli; "
-                "print('IMPORTED' if 'soundmind.pipeline' in sys.modules else 'NONE')"
-            ],
-            capture_output=True,
-            text=True,
-        )
-        assert result.stdout.strip() == "NONE", "soundmind.pipeline was imported"
+        assert "soundmind.pipeline" not in cli_import_probe, "soundmind.pipeline was imported"
 
 
 class TestWorkspaceStructure:
     """Test workspace directory structure."""
 
-    def test_job_directory_has_stage_dirs(self, tmp_path, input_file):
+    def test_job_directory_has_stage_dirs(self, completed_job):
         """Job directory contains stage subdirectories."""
-        job_id = "structure-test-job"
-        jobs_root = tmp_path / "jobs"
-        run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        
-        job_dir = jobs_root / job_id
+        job_dir = completed_job["job_dir"]
         expected_dirs = ["meta", "input", "ingest", "separation", "sqi", "diarization", "events", "rollup"]
         for dir_name in expected_dirs:
             assert (job_dir / dir_name).is_dir(), f"Missing directory: {dir_name}"
 
-    def test_input_file_is_copied(self, tmp_path, input_file):
+    def test_input_file_is_copied(self, completed_job):
         """Input file is copied to input/original.wav."""
-        job_id = "copy-test-job"
-        jobs_root = tmp_path / "jobs"
-        run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        
-        original_wav = jobs_root / job_id / "input" / "original.wav"
+        original_wav = completed_job["job_dir"] / "input" / "original.wav"
         assert original_wav.exists()
-        assert original_wav.read_bytes() == input_file.read_bytes()
+        assert filecmp.cmp(original_wav, completed_job["input_file"], shallow=False)
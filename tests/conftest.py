@@ -4,8 +4,17 @@ SoundMind v1 Test Configuration
 Provides fixtures for creating valid WAV files for testing.
 """
 
+import contextlib
+import hashlib
+import io
+import json
+import operator
+import os
+import shutil
 import subprocess
 import sys
+from collections.abc import Sequence
+from functools import cache, lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -13,9 +22,143 @@ import pytest
 
 from soundmind import audio
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json parses the same documents
+    orjson = None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """
+    Register test markers and, on request, root pytest's tmp directories in RAM.
+    
+    Every pipeline run writes stems and status files that tests read back;
+    a tmpfs keeps that I/O off the disk. It is opt-in: pass
+    `--basetemp=/dev/shm/soundmind-pytest`, or set SOUNDMIND_TEST_TMPDIR
+    (e.g. SOUNDMIND_TEST_TMPDIR=/dev/shm) to use its soundmind-pytest
+    subdirectory as the basetemp. pytest empties the basetemp on every run,
+    hence the dedicated subdirectory. The environment is not modified.
+    """
+    # Registered here so the marker is known even without pytest-xdist
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests sharing a session fixture on one xdist worker",
+    )
+    
+    # tryfirst: must run before pytest's tmpdir plugin reads the option
+    temproot = os.environ.get("SOUNDMIND_TEST_TMPDIR")
+    if temproot and not config.option.basetemp:
+        config.option.basetemp = os.path.join(temproot, "soundmind-pytest")
+
+
+# tools/ scripts (validate_schema) are importable by test modules; added once
+TOOLS_DIR = str(Path(__file__).parent.parent / "tools")
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+
+def read_json(path: Path):
+    """
+    Parse a JSON file straight from its bytes.
+    
+    Uses orjson when installed (faster, no str decode) and falls back to
+    the stdlib json module otherwise.
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def file_digest(path: Path) -> bytes:
+    """
+    BLAKE2b digest of a file, read in chunks.
+    
+    Byte-identical checks on WAV outputs compare digests, so memory use
+    stays constant however long the test audio gets.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "blake2b").digest()
+        digest = hashlib.blake2b()
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+        return digest.digest()
+
+
+def is_sorted(items: Sequence) -> bool:
+    """
+    True if items are in non-decreasing order.
+    
+    One pairwise pass with no sorted copy; works for numbers and for
+    tuple sort keys alike.
+    """
+    return all(map(operator.le, items, items[1:]))
+
+
+def read_wav_cached(path: Path) -> tuple[np.ndarray, int]:
+    """
+    audio.read_wav() memoized by (path, mtime_ns, size).
+    
+    Pipeline outputs are read back by several tests; each file version is
+    decoded once per session. Returns a read-only array; callers that
+    need to modify it must copy.
+    """
+    st = path.stat()
+    return _read_wav_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=128)
+def _read_wav_cached(path_str: str, mtime_ns: int, size: int) -> tuple[np.ndarray, int]:
+    """Decode once per (path, mtime_ns, size); the stat fields only key the cache."""
+    samples, sr = audio.read_wav(Path(path_str))
+    samples.setflags(write=False)
+    return samples, sr
+
 
 def run_cli(*args: str) -> subprocess.CompletedProcess:
-    """Run soundmind CLI as subprocess."""
+    """
+    Run soundmind CLI in-process and capture its result.
+    
+    Calls soundmind.cli.main() with the given argv instead of spawning
+    `python -m soundmind`, so each call skips interpreter startup and the
+    soundmind/numpy/scipy imports. Returns a CompletedProcess so callers
+    can check returncode, stdout and stderr as before. Tests that need a
+    clean interpreter (import isolation) use subprocess directly.
+    """
+    from soundmind.cli import main
+    
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            main(list(args))
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+    
+    return subprocess.CompletedProcess(
+        args=["soundmind", *args],
+        returncode=returncode,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
+
+
+def run_cli_subprocess(*args: str) -> subprocess.CompletedProcess:
+    """
+    Run soundmind CLI as `python -m soundmind` in a fresh interpreter.
+    
+    Byte-identical output tests compare an in-process run against this
+    one, so determinism is checked across processes (no shared module
+    state, caches or hash seed) rather than only within one.
+    """
     return subprocess.run(
         [sys.executable, "-m", "soundmind", *args],
         capture_output=True,
@@ -23,14 +166,17 @@ def run_cli(*args: str) -> subprocess.CompletedProcess:
     )
 
 
-def create_test_wav(path: Path, duration_sec: float = 1.0, with_impulse: bool = False) -> None:
+# Deterministic "speech": sum of a few sine waves
+TEST_SPEECH_FREQS_HZ = np.array([200.0, 400.0, 600.0])
+TEST_SPEECH_AMPS = (0.3, 0.2, 0.1)
+
+
+@cache
+def _test_signal(duration_sec: float, with_impulse: bool) -> np.ndarray:
     """
-    Create a valid WAV file for testing.
+    Synthesize the create_test_wav() signal once per variant.
     
-    Args:
-        path: Output path for WAV file
-        duration_sec: Duration in seconds
-        with_impulse: If True, add impulse events to the audio
+    Returns a read-only array; callers that need to modify it must copy.
     """
     sr = audio.CANONICAL_SAMPLE_RATE
     num_samples = int(sr * duration_sec)
@@ -43,12 +189,11 @@ def create_test_wav(path: Path, duration_sec: float = 1.0, with_impulse: bool =
     speech_end = 2 * num_samples // 3
     t = np.arange(speech_end - speech_start) / sr
     
-    # Deterministic "speech": sum of a few sine waves
-    speech = (
-        0.3 * np.sin(2 * np.pi * 200 * t) +
-        0.2 * np.sin(2 * np.pi * 400 * t) +
-        0.1 * np.sin(2 * np.pi * 600 * t)
-    ).astype(np.float32)
+    # All three sines in one call; summed in the original order
+    sines = np.sin((2 * np.pi * TEST_SPEECH_FREQS_HZ)[:, None] * t)
+    speech = TEST_SPEECH_AMPS[0] * sines[0]
+    for amp, sine in zip(TEST_SPEECH_AMPS[1:], sines[1:]):
+        speech += amp * sine
     
     samples[speech_start:speech_end] = speech
     
@@ -57,48 +202,245 @@ def create_test_wav(path: Path, duration_sec: float = 1.0, with_impulse: bool =
         impulse_pos = num_samples // 6  # In the first silent third
         samples[impulse_pos:impulse_pos + 10] = 0.8
     
-    # Write as valid WAV
-    audio.write_wav(path, samples, sr)
+    samples.setflags(write=False)
+    return samples
+
+
+def create_test_wav(path: Path, duration_sec: float = 1.0, with_impulse: bool = False) -> None:
+    """
+    Create a valid WAV file for testing.
+    
+    Args:
+        path: Output path for WAV file
+        duration_sec: Duration in seconds
+        with_impulse: If True, add impulse events to the audio
+    """
+    # Write as valid WAV (signal is synthesized once per variant)
+    audio.write_wav(path, _test_signal(duration_sec, with_impulse), audio.CANONICAL_SAMPLE_RATE)
+
+
+@pytest.fixture(scope="session")
+def test_wav_factory(tmp_path_factory):
+    """
+    Return a function that places a test WAV at a given path.
+    
+    Each (duration_sec, with_impulse) variant is synthesized and encoded
+    once per session, then hard-linked into place (copied if the link
+    fails, e.g. across filesystems). Linked files share their bytes with
+    the session template, so tests must not modify them in place.
+    """
+    template_dir = tmp_path_factory.mktemp("wav_templates")
+    templates: dict[tuple[float, bool], Path] = {}
+    
+    def make(path: Path, duration_sec: float = 1.0, with_impulse: bool = False) -> Path:
+        key = (duration_sec, with_impulse)
+        template = templates.get(key)
+        if template is None:
+            template = template_dir / f"test_{duration_sec}s_{int(with_impulse)}.wav"
+            create_test_wav(template, duration_sec=duration_sec, with_impulse=with_impulse)
+            templates[key] = template
+        try:
+            os.link(template, path)
+        except OSError:
+            shutil.copyfile(template, path)
+        return path
+    
+    return make
 
 
 @pytest.fixture
-def test_wav_path(tmp_path) -> Path:
+def test_wav_path(tmp_path, test_wav_factory) -> Path:
     """Create a simple test WAV file and return its path."""
-    wav_path = tmp_path / "test_input.wav"
-    create_test_wav(wav_path, duration_sec=1.0)
-    return wav_path
+    return test_wav_factory(tmp_path / "test_input.wav", duration_sec=1.0)
 
 
 @pytest.fixture
-def test_wav_with_impulse(tmp_path) -> Path:
+def test_wav_with_impulse(tmp_path, test_wav_factory) -> Path:
     """Create a test WAV file with impulse and return its path."""
-    wav_path = tmp_path / "test_with_impulse.wav"
-    create_test_wav(wav_path, duration_sec=1.0, with_impulse=True)
-    return wav_path
+    return test_wav_factory(
+        tmp_path / "test_with_impulse.wav", duration_sec=1.0, with_impulse=True
+    )
 
 
-@pytest.fixture
-def pipeline_result(tmp_path, test_wav_path):
+@pytest.fixture(scope="session")
+def pipeline_outputs(tmp_path_factory):
+    """
+    Return a function that runs the pipeline once per input signature.
+    
+    The function takes (duration_sec, with_impulse), the create_test_wav()
+    parameters, and returns a dict with job_dir, input_path and the CLI
+    result. The first call per signature synthesizes the input and runs
+    the pipeline; later calls return the cached run. The pipeline is
+    deterministic, so sharing is equivalent to re-running. Tests must
+    treat the job directory as read-only.
+    """
+    root = tmp_path_factory.mktemp("pipeline")
+    runs: dict[tuple[float, bool], dict] = {}
+    
+    def run(duration_sec: float = 1.0, with_impulse: bool = False) -> dict:
+        key = (duration_sec, with_impulse)
+        if key not in runs:
+            run_dir = root / f"{duration_sec}s_{int(with_impulse)}"
+            run_dir.mkdir()
+            input_path = run_dir / "test_input.wav"
+            create_test_wav(input_path, duration_sec=duration_sec, with_impulse=with_impulse)
+            
+            job_id = "test-job"
+            jobs_root = run_dir / "jobs"
+            
+            result = run_cli(
+                "run",
+                "--input", str(input_path),
+                "--jobs-root", str(jobs_root),
+                "--job-id", job_id,
+            )
+            
+            assert result.returncode == 0, f"Pipeline failed: {result.stderr}"
+            
+            runs[key] = {
+                "job_dir": jobs_root / job_id,
+                "input_path": input_path,
+                "result": result,
+            }
+        return runs[key]
+    
+    return run
+
+
+@pytest.fixture(scope="session")
+def pipeline_for_samples(tmp_path_factory):
+    """
+    Return a function that runs the pipeline once per distinct input signal.
+    
+    The function takes float32 samples (and sample rate), writes them as
+    the input WAV and returns the job directory. Runs are memoized for the
+    session by a SHA-256 of the samples, so tests that build the same
+    signal share one run. The cache is per session on purpose: results
+    never outlive the code that produced them. Tests must treat the job
+    directory as read-only.
+    """
+    root = tmp_path_factory.mktemp("pipeline_by_signal")
+    runs: dict[tuple[str, tuple[int, ...], int], Path] = {}
+    
+    def run(samples: np.ndarray, sr: int = audio.CANONICAL_SAMPLE_RATE) -> Path:
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        key = (hashlib.sha256(samples.tobytes()).hexdigest(), samples.shape, sr)
+        if key not in runs:
+            run_dir = root / f"{key[0][:16]}_{sr}"
+            run_dir.mkdir()
+            input_wav = run_dir / "input.wav"
+            audio.write_wav(input_wav, samples, sr)
+            
+            job_id = "test-job"
+            jobs_root = run_dir / "jobs"
+            result = run_cli(
+                "run",
+                "--input", str(input_wav),
+                "--jobs-root", str(jobs_root),
+                "--job-id", job_id,
+            )
+            assert result.returncode == 0, f"Pipeline failed: {result.stderr}"
+            runs[key] = jobs_root / job_id
+        return runs[key]
+    
+    return run
+
+
+def _dual_run_signal() -> np.ndarray:
+    """
+    2 s input that exercises every stage: a DC "speech" region at
+    0.5-1.5 s and a short impulse at 0.1 s in the non-speech region.
+    """
+    sr = audio.CANONICAL_SAMPLE_RATE
+    samples = np.zeros(int(sr * 2.0), dtype=np.float32)
+    samples[int(0.5 * sr):int(1.5 * sr)] = 0.3
+    impulse_pos = int(0.1 * sr)
+    samples[impulse_pos:impulse_pos + 3] = 0.8
+    return samples
+
+
+@pytest.fixture(scope="session")
+def dual_run(tmp_path_factory) -> tuple[Path, Path]:
+    """
+    Run the pipeline twice on the same input and return both job dirs.
+    
+    The first run is in-process, the second in a fresh interpreter, so
+    byte-identical tests check determinism across processes. Every
+    byte-identical test compares files from these two runs instead of
+    running the pipeline twice itself. Tests must treat both job
+    directories as read-only.
+    """
+    root = tmp_path_factory.mktemp("dual_run")
+    input_wav = root / "input.wav"
+    audio.write_wav(input_wav, _dual_run_signal(), audio.CANONICAL_SAMPLE_RATE)
+    jobs_root = root / "jobs"
+    
+    for job_id, runner in (("run1", run_cli), ("run2", run_cli_subprocess)):
+        result = runner(
+            "run",
+            "--input", str(input_wav),
+            "--jobs-root", str(jobs_root),
+            "--job-id", job_id,
+        )
+        assert result.returncode == 0, f"Pipeline {job_id} failed: {result.stderr}"
+    
+    return jobs_root / "run1", jobs_root / "run2"
+
+
+@pytest.fixture(scope="session")
+def pipeline_result(pipeline_outputs):
     """
     Run pipeline with valid WAV and return paths.
     
     This fixture creates a valid test WAV and runs the full pipeline.
     Use for integration tests that need pipeline output.
-    """
-    job_id = "test-job"
-    jobs_root = tmp_path / "jobs"
     
-    result = run_cli(
-        "run",
-        "--input", str(test_wav_path),
-        "--jobs-root", str(jobs_root),
-        "--job-id", job_id,
-    )
+    Session-scoped: the pipeline runs once per test session and every test
+    reads the same job directory. Tests must treat it as read-only.
+    """
+    return pipeline_outputs(duration_sec=1.0)
+
+
+@pytest.fixture(scope="session")
+def job_files(pipeline_result) -> frozenset[str]:
+    """
+    Relative POSIX paths of every file in the shared job directory.
     
-    assert result.returncode == 0, f"Pipeline failed: {result.stderr}"
+    Collected with one directory walk, so existence checks are set lookups.
+    """
+    job_dir = pipeline_result["job_dir"]
+    files = set()
+    for dirpath, _, filenames in os.walk(job_dir):
+        rel_dir = Path(dirpath).relative_to(job_dir)
+        files.update((rel_dir / name).as_posix() for name in filenames)
+    return frozenset(files)
+
+
+@pytest.fixture(scope="session")
+def job_json(pipeline_result) -> dict[str, dict]:
+    """
+    Every JSON file of the shared pipeline run, parsed once.
     
+    Keys are paths relative to the job directory in POSIX form
+    (e.g. "sqi/sqi.json", "rollup/status.json", "status.json").
+    """
+    job_dir = pipeline_result["job_dir"]
     return {
-        "job_dir": jobs_root / job_id,
-        "input_path": test_wav_path,
-        "result": result,
+        p.relative_to(job_dir).as_posix(): read_json(p)
+        for p in sorted(job_dir.rglob("*.json"))
+    }
+
+
+@pytest.fixture(scope="session")
+def stage_statuses(job_json) -> dict[str, dict]:
+    """
+    Parsed status.json files of the shared pipeline run, read once.
+    
+    Keys are stage names plus "job" for the job-level status.json.
+    """
+    statuses = {
+        stage: job_json[f"{stage}/status.json"]
+        for stage in ("ingest", "separation", "sqi", "diarization", "events", "rollup")
     }
+    statuses["job"] = job_json["status.json"]
+    return statuses
@@ -11,72 +11,69 @@ Commit 6: Updated to verify real content (not stubs).
 """
 
 import json
-from pathlib import Path
+from math import isfinite
 
+import numpy as np
 import pytest
 
-from tests.conftest import create_test_wav
+from soundmind import audio
+from soundmind.context import JobContext
+from soundmind.contracts import StageContext
+from soundmind.stages import rollup, sqi
+from soundmind.stages.base import ArtifactRef, StageFailure
 
+# Every test here reads the shared session pipeline run; under
+# `pytest -n auto --dist loadgroup` they stay on one worker
+pytestmark = pytest.mark.xdist_group(name="shared_pipeline")
 
-class TestArtifactFilesExist:
-    """Verify artifact files are created."""
-
-    def test_separation_stems_exist(self, pipeline_result):
-        """Separation creates speech.wav and residual.wav."""
-        job_dir = pipeline_result["job_dir"]
-        assert (job_dir / "separation" / "stems" / "speech.wav").exists()
-        assert (job_dir / "separation" / "stems" / "residual.wav").exists()
+# Locked SQI metric set
+SQI_METRIC_KEYS = frozenset({
+    "duration_sec",
+    "sample_rate_hz",
+    "num_samples",
+    "rms",
+    "peak_abs",
+    "zero_crossing_rate",
+    "speech_ratio",
+})
 
-    def test_sqi_json_exists(self, pipeline_result):
-        """SQI creates sqi.json."""
-        job_dir = pipeline_result["job_dir"]
-        assert (job_dir / "sqi" / "sqi.json").exists()
 
-    def test_diarization_json_exists(self, pipeline_result):
-        """Diarization creates diarization.json."""
-        job_dir = pipeline_result["job_dir"]
-        assert (job_dir / "diarization" / "diarization.json").exists()
+class TestArtifactFilesExist:
+    """Verify artifact files are created."""
 
-    def test_events_json_exists(self, pipeline_result):
-        """Events creates events.json."""
-        job_dir = pipeline_result["job_dir"]
-        assert (job_dir / "events" / "events.json").exists()
+    @pytest.mark.parametrize("relpath", [
+        "separation/stems/speech.wav",
+        "separation/stems/residual.wav",
+        "sqi/sqi.json",
+        "diarization/diarization.json",
+        "events/events.json",
+    ])
+    def test_artifact_file_exists(self, job_files, relpath):
+        """Each stage artifact file exists in the job directory."""
+        assert relpath in job_files
 
 
 class TestRealContent:
     """Verify real content (Commit 6 replaces stubs)."""
 
-    def test_sqi_has_metrics(self, pipeline_result):
+    def test_sqi_has_metrics(self, job_json):
         """SQI has metrics with locked keys."""
-        job_dir = pipeline_result["job_dir"]
-        sqi = json.loads((job_dir / "sqi" / "sqi.json").read_text())
+        sqi = job_json["sqi/sqi.json"]
         
         assert "metrics" in sqi
         metrics = sqi["metrics"]
         
-        # Locked metric set
-        expected_keys = {
-            "duration_sec",
-            "sample_rate_hz",
-            "num_samples",
-            "rms",
-            "peak_abs",
-            "zero_crossing_rate",
-            "speech_ratio",
-        }
-        assert set(metrics.keys()) == expected_keys
+        assert metrics.keys() == SQI_METRIC_KEYS
         
         # All values are finite
         for key, value in metrics.items():
             assert isinstance(value, (int, float))
             if isinstance(value, float):
-                import math
-                assert math.isfinite(value), f"{key} is not finite"
+                assert isfinite(value), f"{key} is not finite"
 
-    def test_diarization_structure(self, pipeline_result):
+    def test_diarization_structure(self, job_json):
         """Diarization has proper structure."""
-        job_dir = pipeline_result["job_dir"]
-        diarization = json.loads((job_dir / "diarization" / "diarization.json").read_text())
+        diarization = job_json["diarization/diarization.json"]
         
         assert diarization["sample_rate"] == 16000
         assert "speakers" in diarization
@@ -89,10 +86,9 @@ class TestRealContent:
                 assert "start_s" in seg
                 assert "end_s" in seg
 
-    def test_events_structure(self, pipeline_result):
+    def test_events_structure(self, job_json):
         """Events has proper structure."""
-        job_dir = pipeline_result["job_dir"]
-        events = json.loads((job_dir / "events" / "events.json").read_text())
+        events = job_json["events/events.json"]
         
         assert "events" in events
         
@@ -107,48 +103,75 @@ class TestRealContent:
 class TestArtifactRefs:
     """Verify artifacts[] in stage status.json."""
 
-    def test_ingest_produces_audio_original(self, pipeline_result):
+    def test_ingest_produces_audio_original(self, stage_statuses):
         """Ingest produces audio/original artifact (Commit 5)."""
-        job_dir = pipeline_result["job_dir"]
-        status = json.loads((job_dir / "ingest" / "status.json").read_text())
+        status = stage_statuses["ingest"]
         assert len(status["artifacts"]) == 1
         assert status["artifacts"][0]["role"] == "audio/original"
         assert status["artifacts"][0]["path"] == "input/original.wav"
 
-    def test_separation_has_two_artifacts(self, pipeline_result):
+    def test_separation_has_two_artifacts(self, stage_statuses):
         """Separation produces speech and residual artifact refs."""
-        job_dir = pipeline_result["job_dir"]
-        status = json.loads((job_dir / "separation" / "status.json").read_text())
+        status = stage_statuses["separation"]
         assert len(status["artifacts"]) == 2
         
         paths = [a["path"] for a in status["artifacts"]]
         assert "separation/stems/speech.wav" in paths
         assert "separation/stems/residual.wav" in paths
 
-    def test_artifact_ref_shape(self, pipeline_result):
+    def test_artifact_ref_shape(self, stage_statuses):
         """Artifact refs have frozen shape: path, type, role, description."""
-        job_dir = pipeline_result["job_dir"]
-        status = json.loads((job_dir / "separation" / "status.json").read_text())
+        status = stage_statuses["separation"]
         
         for artifact in status["artifacts"]:
-            assert set(artifact.keys()) == {"path", "type", "role", "description"}
+            # The frozen dataclass rejects missing or extra keys (TypeError)
+            ref = ArtifactRef(**artifact)
+            assert ref.to_dict() == artifact
 
 
 class TestRollupAggregation:
     """Verify rollup aggregates all artifacts."""
 
-    def test_rollup_has_all_artifacts(self, pipeline_result):
+    def test_rollup_has_all_artifacts(self, stage_statuses):
         """Rollup aggregates artifacts from all stages."""
-        job_dir = pipeline_result["job_dir"]
-        status = json.loads((job_dir / "rollup" / "status.json").read_text())
+        status = stage_statuses["rollup"]
         
         # Should have 6 artifacts: 1 from ingest, 2 from separation, 1 from sqi, 1 from diarization, 1 from events
         assert len(status["artifacts"]) == 6
 
-    def test_rollup_preserves_stage_order(self, pipeline_result):
+    def test_rollup_success_is_bool(self, stage_statuses):
+        """Rollup success is a JSON boolean, as the schema requires."""
+        assert stage_statuses["rollup"]["success"] is True
+
+    @pytest.mark.parametrize("stage_success", [None, 0, "", 1, "yes"])
+    def test_rollup_coerces_non_bool_stage_success(self, tmp_path, stage_success):
+        """A non-bool stage "success" still yields a boolean rollup success."""
+        stage_dirs = {}
+        for name in (*rollup.EXPECTED_STAGES, "rollup"):
+            stage_dirs[name] = tmp_path / name
+            stage_dirs[name].mkdir()
+        for name in rollup.EXPECTED_STAGES:
+            status = {"success": True, "artifacts": []}
+            (stage_dirs[name] / "status.json").write_text(json.dumps(status))
+        last = stage_dirs[rollup.EXPECTED_STAGES[-1]] / "status.json"
+        last.write_text(json.dumps({"success": stage_success, "artifacts": []}))
+        
+        ctx = JobContext(
+            job_id="rollup-bool-test",
+            job_dir=tmp_path,
+            meta_dir=tmp_path / "meta",
+            input_wav_path=tmp_path / "input.wav",
+            input_json_path=tmp_path / "input.json",
+            stage_dirs=stage_dirs,
+        )
+        rollup.run(ctx)
+        
+        success = json.loads((stage_dirs["rollup"] / "status.json").read_text())["success"]
+        assert success is bool(stage_success)
+
+    def test_rollup_preserves_stage_order(self, stage_statuses):
         """Rollup artifacts are in stage order."""
-        job_dir = pipeline_result["job_dir"]
-        status = json.loads((job_dir / "rollup" / "status.json").read_text())
+        status = stage_statuses["rollup"]
         
         paths = [a["path"] for a in status["artifacts"]]
         
@@ -164,19 +187,65 @@ class TestRollupAggregation:
 class TestJobLevelArtifacts:
     """Verify job-level status.json contains artifacts."""
 
-    def test_job_status_has_artifacts(self, pipeline_result):
+    def test_job_status_has_artifacts(self, stage_statuses):
         """Job-level status.json includes aggregated artifacts."""
-        job_dir = pipeline_result["job_dir"]
-        status = json.loads((job_dir / "status.json").read_text())
+        status = stage_statuses["job"]
         
         assert "artifacts" in status
         assert len(status["artifacts"]) == 6  # Commit 5: includes ingest's audio/original
 
-    def test_job_artifacts_match_rollup(self, pipeline_result):
+    def test_job_artifacts_match_rollup(self, stage_statuses):
         """Job-level artifacts match rollup artifacts."""
-        job_dir = pipeline_result["job_dir"]
-        
-        job_status = json.loads((job_dir / "status.json").read_text())
-        rollup_status = json.loads((job_dir / "rollup" / "status.json").read_text())
+        job_status = stage_statuses["job"]
+        rollup_status = stage_statuses["rollup"]
         
         assert job_status["artifacts"] == rollup_status["artifacts"]
+
+
+class TestSqiStemCheck:
+    """SQI fails on a non-canonical speech stem instead of mislabeling it."""
+
+    @pytest.fixture(params=[(44100, 1), (16000, 2)], ids=["44k1_mono", "16k_stereo"])
+    def bad_stem_job(self, request, tmp_path):
+        """Job dir whose speech stem is not mono 16 kHz."""
+        sr, channels = request.param
+        samples = np.full(sr // 2, 0.25, dtype=np.float32)
+        if channels > 1:
+            samples = np.stack([samples] * channels, axis=1)
+        stems_dir = tmp_path / "separation" / "stems"
+        stems_dir.mkdir(parents=True)
+        audio.write_wav(stems_dir / "speech.wav", samples, sr)
+        (tmp_path / "sqi").mkdir()
+        return tmp_path
+
+    def _assert_failed(self, job_dir):
+        status = json.loads((job_dir / "sqi" / "status.json").read_text())
+        assert status["success"] is False
+        assert status["errors"][0]["code"] == "SQI_NON_CANONICAL_STEM"
+        assert not (job_dir / "sqi" / "sqi.json").exists()
+
+    def test_adapter_rejects_non_canonical_stem(self, bad_stem_job):
+        ctx = JobContext(
+            job_id="sqi-check",
+            job_dir=bad_stem_job,
+            meta_dir=bad_stem_job / "meta",
+            input_wav_path=bad_stem_job / "input.wav",
+            input_json_path=bad_stem_job / "input.json",
+            stage_dirs={name: bad_stem_job / name for name in ("separation", "sqi")},
+        )
+        with pytest.raises(StageFailure) as excinfo:
+            sqi.run(ctx)
+        assert excinfo.value.stage == "sqi"
+        self._assert_failed(bad_stem_job)
+
+    def test_stage_rejects_non_canonical_stem(self, bad_stem_job):
+        ctx = StageContext(
+            job_id="sqi-check",
+            input_audio=bad_stem_job / "input.wav",
+            workspace=bad_stem_job,
+            artifacts=(),
+            pipeline_version="1.0.0",
+        )
+        with pytest.raises(StageFailure):
+            sqi.SqiStage().run(ctx)
+        self._assert_failed(bad_stem_job)
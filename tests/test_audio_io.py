@@ -0,0 +1,350 @@
+"""
+SoundMind v1 Audio I/O Tests
+
+Unit tests for the WAV read/write primitives in soundmind.audio:
+- write_wav() is byte-identical to libsndfile's PCM-16 writer
+- read_wav()/read_wav_int16() match libsndfile on every WAV layout
+- Stems reused within a pipeline run equal the files on disk
+- _downmix_mono() is bit-identical to np.mean(axis=1)
+- all_finite() is exact across chunk boundaries and threads
+"""
+
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from soundmind import audio
+from soundmind.context import JobContext
+from soundmind.jobs import STAGE_NAMES, create_full_workspace
+from soundmind.pipeline import run_pipeline
+from soundmind.stages import diarization, events, ingest, separation, sqi
+from soundmind.stages.base import read_stem, read_stem_int16
+
+SR = audio.CANONICAL_SAMPLE_RATE
+
+
+def _ramp(n: int, scale: float = 0.5) -> np.ndarray:
+    """Deterministic float32 signal with distinct PCM-16 values."""
+    return (scale * np.linspace(-1.0, 1.0, n)).astype(np.float32)
+
+
+def _disk_int16(path) -> np.ndarray:
+    """The file's PCM-16 samples as decoded by libsndfile."""
+    samples, _ = sf.read(path, dtype="int16", always_2d=False)
+    return samples
+
+
+def _job_context(tmp_path, samples: np.ndarray) -> JobContext:
+    """Workspace + JobContext as the CLI builds them, input written as PCM-16."""
+    paths = create_full_workspace(tmp_path / "jobs", "stem-test")
+    input_wav_path = paths["input_dir"] / "original.wav"
+    audio.write_wav(input_wav_path, samples, SR)
+    return JobContext(
+        job_id="stem-test",
+        job_dir=paths["job_dir"],
+        meta_dir=paths["meta_dir"],
+        input_wav_path=input_wav_path,
+        input_json_path=paths["input_dir"] / "input.json",
+        stage_dirs={name: paths[name] for name in STAGE_NAMES},
+    )
+
+
+def _speech_and_impulse() -> np.ndarray:
+    """2 s: DC speech over the middle, a 3-sample impulse in the silence."""
+    samples = np.zeros(2 * SR, dtype=np.float32)
+    samples[SR // 2:3 * SR // 2] = 0.3
+    samples[SR // 10:SR // 10 + 3] = 0.8
+    return samples
+
+
+class TestRunScopedStems:
+    """Stems reused within one run must equal the files on disk."""
+
+    def test_write_wav_returns_written_pcm(self, tmp_path):
+        """write_wav() returns the file's PCM; pcm16_to_float() decodes it like read_wav()."""
+        path = tmp_path / "a.wav"
+        pcm = audio.write_wav(path, _ramp(5000, scale=1.5), SR)
+
+        np.testing.assert_array_equal(pcm, _disk_int16(path))
+        decoded, _ = audio.read_wav(path)
+        np.testing.assert_array_equal(audio.pcm16_to_float(pcm), decoded)
+
+    def test_separation_caches_written_stems(self, tmp_path):
+        """Stage B leaves exactly its two stems, as written, in ctx.pcm_cache."""
+        ctx = _job_context(tmp_path, _speech_and_impulse())
+        separation.run(ingest.run(ctx))
+
+        stems_dir = ctx.stage_dirs["separation"] / "stems"
+        assert set(ctx.pcm_cache) == {stems_dir / "speech.wav", stems_dir / "residual.wav"}
+        for path, (pcm, sr) in ctx.pcm_cache.items():
+            assert sr == SR
+            np.testing.assert_array_equal(pcm, _disk_int16(path))
+
+    def test_read_stem_matches_disk(self, tmp_path):
+        """read_stem*() hits return what audio.read_wav*() decode from the file."""
+        ctx = _job_context(tmp_path, _speech_and_impulse())
+        separation.run(ingest.run(ctx))
+
+        for path in list(ctx.pcm_cache):
+            samples, sr = read_stem(path, ctx.pcm_cache)
+            reference, reference_sr = audio.read_wav(path)
+            assert samples.dtype == reference.dtype and sr == reference_sr
+            np.testing.assert_array_equal(samples, reference)
+
+            pcm, _ = read_stem_int16(path, ctx.pcm_cache)
+            np.testing.assert_array_equal(pcm, audio.read_wav_int16(path)[0])
+            # A hit is a copy: callers cannot corrupt the run's PCM
+            assert pcm is not ctx.pcm_cache[path][0]
+
+    def test_read_stem_without_cache_reads_file(self, tmp_path):
+        """With no run cache, read_stem() is audio.read_wav()."""
+        path = tmp_path / "a.wav"
+        audio.write_wav(path, _ramp(1000), SR)
+
+        samples, _ = read_stem(path)
+
+        np.testing.assert_array_equal(samples, audio.read_wav(path)[0])
+
+    def test_outputs_match_uncached_run(self, tmp_path):
+        """Stages C-E write the same bytes whether the stems come from the cache or disk."""
+        outputs = []
+        for name in ("cached", "uncached"):
+            ctx = _job_context(tmp_path / name, _speech_and_impulse())
+            separation.run(ingest.run(ctx))
+            if name == "uncached":
+                ctx.pcm_cache.clear()
+            events.run(diarization.run(sqi.run(ctx)))
+            outputs.append([
+                (ctx.job_dir / rel).read_bytes()
+                for rel in (
+                    "sqi/sqi.json",
+                    "diarization/diarization.json",
+                    "diarization/per_speaker/SPEAKER_00.wav",
+                    "events/events.json",
+                )
+            ])
+
+        assert outputs[0] == outputs[1]
+        assert b"impulsive_sound" in outputs[0][3]
+
+    def test_run_pipeline_drops_cache(self, tmp_path):
+        """The stems' PCM does not outlive the run."""
+        ctx = _job_context(tmp_path, _speech_and_impulse())
+
+        assert run_pipeline(ctx)
+        assert ctx.pcm_cache == {}
+
+
+def _tie_values() -> np.ndarray:
+    """Values whose scaled forms land exactly on rounding ties."""
+    lsb = 1.0 / 32768.0
+    k = np.arange(-5, 6, dtype=np.float64)
+    return np.concatenate([
+        # x * 2**31 == n + 0.5 (rint ties, both parities)
+        np.array([1.5, 2.5, -1.5, -2.5, 0.5, -0.5]) / 2.0**31,
+        # Half a PCM-16 step: floor of / 2**16 lands between two codes
+        (k + 0.5) * lsb,
+        k * lsb,
+    ]).astype(np.float32)
+
+
+def _tile_ramp(n: int) -> np.ndarray:
+    """Ramp long enough to span PCM16_TILE_SAMPLES boundaries."""
+    return _ramp(n, scale=1.2)
+
+
+_PCM16_CASES = {
+    "ties": lambda: _tie_values(),
+    "full_scale": lambda: np.array([1.0, -1.0, 0.0, 1.0, -1.0], dtype=np.float32),
+    "near_full_scale": lambda: np.array(
+        [np.nextafter(np.float32(1.0), np.float32(0.0)),
+         np.nextafter(np.float32(-1.0), np.float32(0.0))],
+        dtype=np.float32,
+    ),
+    "out_of_range": lambda: np.array([1.5, -1.5, 100.0, -100.0, 3e38, -3e38], dtype=np.float32),
+    "denormals": lambda: np.array(
+        [1e-45, -1e-45, 1e-40, -1e-40, np.finfo(np.float32).tiny, 0.0, -0.0],
+        dtype=np.float32,
+    ),
+    "empty": lambda: np.zeros(0, dtype=np.float32),
+    "stereo": lambda: np.stack([_ramp(3001), -_ramp(3001, scale=1.1)], axis=1),
+    "tile_minus_one": lambda: _tile_ramp(audio.PCM16_TILE_SAMPLES - 1),
+    "tile_exact": lambda: _tile_ramp(audio.PCM16_TILE_SAMPLES),
+    "tile_plus_one": lambda: _tile_ramp(audio.PCM16_TILE_SAMPLES + 1),
+    "two_tiles_stereo": lambda: np.stack(
+        [_tile_ramp(audio.PCM16_TILE_SAMPLES + 7)] * 2, axis=1
+    ),
+}
+
+
+class TestWriteWavMatchesLibsndfile:
+    """write_wav() output is byte-identical to sf.write(..., subtype="PCM_16")."""
+
+    @pytest.mark.parametrize("case", sorted(_PCM16_CASES))
+    @pytest.mark.parametrize("sample_rate", [8000, 16000, 44100, 48000])
+    def test_bytes_identical(self, tmp_path, case, sample_rate):
+        """Same bytes as libsndfile writing the clipped floats."""
+        samples = _PCM16_CASES[case]()
+        ours = tmp_path / "ours.wav"
+        reference = tmp_path / "reference.wav"
+
+        audio.write_wav(ours, samples, sample_rate)
+        # write_wav hard clips first; libsndfile is given the clipped floats
+        sf.write(
+            reference, np.clip(samples, -1.0, 1.0), sample_rate,
+            format="WAV", subtype="PCM_16",
+        )
+
+        assert ours.read_bytes() == reference.read_bytes()
+
+
+def _sf_wav_bytes(tmp_path, samples: np.ndarray, **kwargs) -> bytes:
+    """Bytes of a WAV written by libsndfile (never touches audio's cache)."""
+    path = tmp_path / "sf_tmp.wav"
+    kwargs.setdefault("format", "WAV")
+    kwargs.setdefault("subtype", "PCM_16")
+    sf.write(path, samples, SR, **kwargs)
+    data = path.read_bytes()
+    path.unlink()
+    return data
+
+
+def _with_chunk(wav: bytes, chunk: bytes, after_data: bool = False) -> bytes:
+    """Insert a RIFF chunk before (or after) the data chunk of a canonical WAV."""
+    data_pos = wav.index(b"data")
+    if after_data:
+        body = wav[12:] + chunk
+    else:
+        body = wav[12:data_pos] + chunk + wav[data_pos:]
+    return b"RIFF" + struct.pack("<I", 4 + len(body)) + b"WAVE" + body
+
+
+def _list_chunk(payload: bytes) -> bytes:
+    """LIST chunk with RIFF pad byte when the payload size is odd."""
+    pad = b"\x00" if len(payload) & 1 else b""
+    return b"LIST" + struct.pack("<I", len(payload)) + payload + pad
+
+
+def _fmt18(wav: bytes) -> bytes:
+    """Rewrite the 16-byte fmt chunk as an 18-byte one (cbSize = 0)."""
+    fmt_pos = wav.index(b"fmt ")
+    body = wav[fmt_pos + 8:fmt_pos + 24] + b"\x00\x00"
+    rest = wav[12:fmt_pos] + b"fmt " + struct.pack("<I", 18) + body + wav[fmt_pos + 24:]
+    return b"RIFF" + struct.pack("<I", 4 + len(rest)) + b"WAVE" + rest
+
+
+_MONO = _ramp(1001, scale=0.9)
+_STEREO = np.stack([_ramp(1001, scale=0.9), -_ramp(1001, scale=0.3)], axis=1)
+
+# name -> (bytes builder, served by the memory-mapped fast path?)
+_WAV_LAYOUTS = {
+    "pcm16_mono": (lambda d: _sf_wav_bytes(d, _MONO), True),
+    "pcm16_stereo": (lambda d: _sf_wav_bytes(d, _STEREO), True),
+    "pcm16_empty": (lambda d: _sf_wav_bytes(d, _MONO[:0]), True),
+    "list_chunk_odd": (
+        lambda d: _with_chunk(_sf_wav_bytes(d, _MONO), _list_chunk(b"INFOabc")), True
+    ),
+    "list_chunk_after_data": (
+        lambda d: _with_chunk(_sf_wav_bytes(d, _MONO), _list_chunk(b"INFOx"), after_data=True), True
+    ),
+    "fmt_18_bytes": (lambda d: _fmt18(_sf_wav_bytes(d, _MONO)), True),
+    "rifx": (lambda d: _sf_wav_bytes(d, _MONO, endian="BIG"), False),
+    "rf64": (lambda d: _sf_wav_bytes(d, _MONO, format="RF64"), False),
+    "extensible": (lambda d: _sf_wav_bytes(d, _STEREO, format="WAVEX"), False),
+    "float32": (lambda d: _sf_wav_bytes(d, _MONO, subtype="FLOAT"), False),
+    "pcm24": (lambda d: _sf_wav_bytes(d, _MONO, subtype="PCM_24"), False),
+    "truncated_data": (lambda d: _sf_wav_bytes(d, _MONO)[:-11], False),
+}
+
+
+class TestReadWavLayouts:
+    """The RIFF walker in _map_pcm16 maps plain PCM-16 and defers the rest."""
+
+    @pytest.mark.parametrize("layout", sorted(_WAV_LAYOUTS))
+    def test_reads_match_libsndfile(self, tmp_path, layout):
+        """read_wav() and read_wav_int16() equal sf.read() for each layout."""
+        build, fast_path = _WAV_LAYOUTS[layout]
+        path = tmp_path / "input.wav"
+        path.write_bytes(build(tmp_path))
+
+        assert (audio._map_pcm16(path) is not None) == fast_path
+
+        samples, sr = audio.read_wav(path)
+        expected, expected_sr = sf.read(path, dtype="float32", always_2d=False)
+        assert sr == expected_sr
+        assert samples.dtype == expected.dtype
+        np.testing.assert_array_equal(samples, expected)
+
+        pcm, sr = audio.read_wav_int16(path)
+        expected, expected_sr = sf.read(path, dtype="int16", always_2d=False)
+        assert sr == expected_sr
+        assert pcm.dtype == expected.dtype
+        np.testing.assert_array_equal(pcm, expected)
+
+
+def _mixed_magnitudes(n: int, channels: int, dtype) -> np.ndarray:
+    """(n, channels) samples spanning 7 decades, so summation order changes the bits."""
+    k = np.arange(n * channels, dtype=np.float64)
+    values = np.sin(k * 0.7311) * 10.0 ** (k % 7 - 3)
+    return values.reshape(n, channels).astype(dtype)
+
+
+class TestDownmixMono:
+    """_downmix_mono() must stay bit-identical to np.mean(axis=1)."""
+
+    # Fails if a NumPy release stops summing short rows sequentially
+    @pytest.mark.parametrize("channels", range(1, audio.DOWNMIX_COLUMN_MAX_CHANNELS))
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_matches_np_mean(self, channels, dtype, order):
+        samples = np.asarray(_mixed_magnitudes(4099, channels, dtype), order=order)
+
+        mono = audio._downmix_mono(samples)
+
+        expected = np.mean(samples, axis=1)
+        assert mono.dtype == expected.dtype
+        np.testing.assert_array_equal(mono, expected)
+
+    @pytest.mark.parametrize("channels", [2, 3, audio.DOWNMIX_COLUMN_MAX_CHANNELS, 11])
+    @pytest.mark.parametrize("dtype", [np.float16, np.int16])
+    def test_other_inputs_use_np_mean(self, channels, dtype):
+        """float16 (float32 accumulator in np.mean), integer and wide input."""
+        samples = (_mixed_magnitudes(1000, channels, np.float64) * 30).astype(dtype)
+
+        mono = audio._downmix_mono(samples)
+
+        expected = np.mean(samples, axis=1)
+        assert mono.dtype == expected.dtype
+        np.testing.assert_array_equal(mono, expected)
+
+
+class TestAllFinite:
+    """all_finite() scans in chunks without shared scratch."""
+
+    @pytest.mark.parametrize(
+        "bad_index", [0, audio.FINITE_SCAN_CHUNK - 1, audio.FINITE_SCAN_CHUNK, -1]
+    )
+    def test_non_finite_found_in_any_chunk(self, bad_index):
+        """A single NaN is found wherever it sits relative to chunk edges."""
+        samples = np.zeros(audio.FINITE_SCAN_CHUNK + 5, dtype=np.float32)
+        assert audio.all_finite(samples)
+
+        samples[bad_index] = np.nan
+        assert not audio.all_finite(samples)
+
+    def test_concurrent_calls(self):
+        """Interleaved calls from threads on different sizes never mix results."""
+        clean = [np.zeros(n, dtype=np.float32) for n in (7, 1000, audio.FINITE_SCAN_CHUNK + 3)]
+        dirty = [x.copy() for x in clean]
+        for x in dirty:
+            x[-1] = np.inf
+        inputs = (clean + dirty) * 20
+        expected = [bool(np.isfinite(x).all()) for x in inputs]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(audio.all_finite, inputs))
+
+        assert results == expected
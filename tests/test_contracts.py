@@ -12,64 +12,63 @@ Coverage:
 - Contract enforcement (produced roles match contract)
 """
 
+import importlib
 import json
-import subprocess
-import sys
 from dataclasses import FrozenInstanceError
-from pathlib import Path
 
 import pytest
 
 from soundmind.contracts import (
-    PIPELINE_VERSION,
-    Stage,
-    StageContract,
     StageContext,
+    StageContract,
     StageValidator,
     ValidationError,
 )
 from soundmind.stages.base import ArtifactRef, build_artifact_ref
 
-
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def sample_artifacts() -> list[ArtifactRef]:
-    """Create sample artifacts for testing."""
-    return [
-        build_artifact_ref(
-            path="input/original.wav",
-            artifact_type="audio/wav",
-            role="audio/original",
-            description="Test original audio",
-        ),
-        build_artifact_ref(
-            path="separation/stems/speech.wav",
-            artifact_type="audio/wav",
-            role="audio/speech",
-            description="Test speech stem",
-        ),
-        build_artifact_ref(
-            path="separation/stems/residual.wav",
-            artifact_type="audio/wav",
-            role="audio/residual",
-            description="Test residual stem",
-        ),
-        build_artifact_ref(
-            path="sqi/sqi.json",
-            artifact_type="application/json",
-            role="metadata/sqi",
-            description="Test SQI",
-        ),
-    ]
-
-
-@pytest.fixture
+# Frozen ArtifactRefs, so one tuple is safely shared by every test
+SAMPLE_ARTIFACTS = (
+    build_artifact_ref(
+        path="input/original.wav",
+        artifact_type="audio/wav",
+        role="audio/original",
+        description="Test original audio",
+    ),
+    build_artifact_ref(
+        path="separation/stems/speech.wav",
+        artifact_type="audio/wav",
+        role="audio/speech",
+        description="Test speech stem",
+    ),
+    build_artifact_ref(
+        path="separation/stems/residual.wav",
+        artifact_type="audio/wav",
+        role="audio/residual",
+        description="Test residual stem",
+    ),
+    build_artifact_ref(
+        path="sqi/sqi.json",
+        artifact_type="application/json",
+        role="metadata/sqi",
+        description="Test SQI",
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def sample_artifacts() -> tuple[ArtifactRef, ...]:
+    """Sample artifacts for testing (module-level, built once)."""
+    return SAMPLE_ARTIFACTS
+
+
+@pytest.fixture(scope="session")
 def validator() -> StageValidator:
-    """Create a validator instance."""
+    """Create a validator instance (stateless, shared per session)."""
     return StageValidator()
 
 
@@ -298,55 +297,27 @@ class TestArtifactRefImmutability:
 # Test: Stage Status JSON Schema (Commit 5 Format)
 # =============================================================================
 
-
-def run_cli(*args: str) -> subprocess.CompletedProcess:
-    """Run soundmind CLI as subprocess."""
-    return subprocess.run(
-        [sys.executable, "-m", "soundmind", *args],
-        capture_output=True,
-        text=True,
-    )
+# Allowed artifact role prefixes
+ROLE_PREFIXES = ("audio/", "metadata/")
 
 
+@pytest.mark.xdist_group(name="shared_pipeline")
 class TestStageStatusSchema:
     """Test enhanced stage status.json schema correctness."""
 
-    @pytest.fixture
-    def pipeline_result(self, tmp_path):
-        """Run pipeline and return job directory."""
-        from tests.conftest import create_test_wav
-        input_file = tmp_path / "test_input.wav"
-        create_test_wav(input_file, duration_sec=0.5)
-        
-        job_id = "status-schema-test"
-        jobs_root = tmp_path / "jobs"
-        
-        result = run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        
-        assert result.returncode == 0, f"Pipeline failed: {result.stderr}"
-        return jobs_root / job_id
-
-    def test_status_json_has_artifacts_key(self, pipeline_result):
+    def test_status_json_has_artifacts_key(self, job_files, stage_statuses):
         """Each stage status.json has artifacts key."""
         for stage in ["ingest", "separation", "sqi", "diarization", "events", "rollup"]:
-            status_path = pipeline_result / stage / "status.json"
-            assert status_path.exists()
-            status = json.loads(status_path.read_text())
-            assert "artifacts" in status
+            assert f"{stage}/status.json" in job_files
+            assert "artifacts" in stage_statuses[stage]
 
-    def test_artifact_roles_use_prefix_format(self, pipeline_result):
+    def test_artifact_roles_use_prefix_format(self, stage_statuses):
         """All artifact roles use audio/* or metadata/* prefix."""
         for stage in ["ingest", "separation", "sqi", "diarization", "events"]:
-            status = json.loads((pipeline_result / stage / "status.json").read_text())
-            for artifact in status.get("artifacts", []):
+            status = stage_statuses[stage]
+            for artifact in status.get("artifacts", ()):
                 role = artifact["role"]
-                assert role.startswith("audio/") or role.startswith("metadata/"), \
-                    f"Role '{role}' in {stage} doesn't have prefix"
+                assert role.startswith(ROLE_PREFIXES), (stage, role)
 
 
 # =============================================================================
@@ -354,31 +325,13 @@ class TestStageStatusSchema:
 # =============================================================================
 
 
+@pytest.mark.xdist_group(name="shared_pipeline")
 class TestDeterministicOrdering:
     """Test that artifacts and metadata have deterministic ordering."""
 
-    @pytest.fixture
-    def pipeline_result(self, tmp_path):
-        """Run pipeline and return job directory."""
-        from tests.conftest import create_test_wav
-        input_file = tmp_path / "test_input.wav"
-        create_test_wav(input_file, duration_sec=0.5)
-        
-        job_id = "ordering-test"
-        jobs_root = tmp_path / "jobs"
-        
-        result = run_cli(
-            "run",
-            "--input", str(input_file),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        assert result.returncode == 0, f"Pipeline failed: {result.stderr}"
-        return jobs_root / job_id
-
-    def test_rollup_artifacts_in_stage_order(self, pipeline_result):
+    def test_rollup_artifacts_in_stage_order(self, stage_statuses):
         """Rollup artifacts follow stage execution order."""
-        status = json.loads((pipeline_result / "rollup" / "status.json").read_text())
+        status = stage_statuses["rollup"]
         paths = [a["path"] for a in status["artifacts"]]
         
         # Verify order: ingest → separation → sqi → diarization → events
@@ -391,7 +344,7 @@ class TestDeterministicOrdering:
 
     def test_artifact_dict_keys_sorted(self, pipeline_result):
         """JSON output has sorted keys for determinism."""
-        status_text = (pipeline_result / "ingest" / "status.json").read_text()
+        status_text = (pipeline_result["job_dir"] / "ingest" / "status.json").read_text()
         status = json.loads(status_text)
         
         # Check that when re-serialized with sort_keys, it matches
@@ -407,60 +360,28 @@ class TestDeterministicOrdering:
 class TestContractDefinitions:
     """Test that stage contracts are defined correctly."""
 
-    def test_ingest_contract(self):
-        """Ingest contract: requires={}, produces={audio/original}."""
-        from soundmind.stages.ingest import CONTRACT
-        
-        assert CONTRACT.name == "ingest"
-        assert CONTRACT.requires == frozenset()
-        assert CONTRACT.produces == frozenset({"audio/original"})
-
-    def test_separation_contract(self):
-        """Separation contract: requires={audio/original}, produces={audio/speech, audio/residual}."""
-        from soundmind.stages.separation import CONTRACT
-        
-        assert CONTRACT.name == "separation"
-        assert CONTRACT.requires == frozenset({"audio/original"})
-        assert CONTRACT.produces == frozenset({"audio/speech", "audio/residual"})
-
-    def test_sqi_contract(self):
-        """SQI contract: requires={audio/speech}, produces={metadata/sqi}."""
-        from soundmind.stages.sqi import CONTRACT
-        
-        assert CONTRACT.name == "sqi"
-        assert CONTRACT.requires == frozenset({"audio/speech"})
-        assert CONTRACT.produces == frozenset({"metadata/sqi"})
-
-    def test_diarization_contract(self):
-        """Diarization contract: requires={audio/speech}, produces={metadata/diarization, audio/diarized_speaker}."""
-        from soundmind.stages.diarization import CONTRACT
-        
-        assert CONTRACT.name == "diarization"
-        assert CONTRACT.requires == frozenset({"audio/speech"})
-        assert CONTRACT.produces == frozenset({"metadata/diarization", "audio/diarized_speaker"})
-
-    def test_events_contract(self):
-        """Events contract: requires={audio/residual}, produces={metadata/events}."""
-        from soundmind.stages.events import CONTRACT
-        
-        assert CONTRACT.name == "events"
-        assert CONTRACT.requires == frozenset({"audio/residual"})
-        assert CONTRACT.produces == frozenset({"metadata/events"})
-
-    def test_rollup_contract(self):
-        """Rollup contract: requires all 6 artifacts, produces={}."""
-        from soundmind.stages.rollup import CONTRACT
-        
-        assert CONTRACT.name == "rollup"
-        assert CONTRACT.requires == frozenset({
+    @pytest.mark.parametrize("stage, requires, produces", [
+        ("ingest", set(), {"audio/original"}),
+        ("separation", {"audio/original"}, {"audio/speech", "audio/residual"}),
+        ("sqi", {"audio/speech"}, {"metadata/sqi"}),
+        ("diarization", {"audio/speech"}, {"metadata/diarization", "audio/diarized_speaker"}),
+        ("events", {"audio/residual"}, {"metadata/events"}),
+        ("rollup", {
             "audio/original",
             "audio/speech",
             "audio/residual",
             "metadata/sqi",
             "metadata/diarization",
             "metadata/events",
-        })
-        assert CONTRACT.produces == frozenset()
+        }, set()),
+    ])
+    def test_stage_contract(self, stage, requires, produces):
+        """Each stage's CONTRACT declares its name, required and produced roles."""
+        contract = importlib.import_module(f"soundmind.stages.{stage}").CONTRACT
+        
+        assert contract.name == stage
+        assert contract.requires == frozenset(requires)
+        assert contract.produces == frozenset(produces)
 
 
 # =============================================================================
@@ -8,190 +8,140 @@ Verifies deterministic output guarantees:
 - speech + residual == input (in float32 before quantization)
 """
 
-import json
-from pathlib import Path
-
 import numpy as np
 import pytest
+import soundfile as sf
 
 from soundmind import audio
-from tests.conftest import create_test_wav, run_cli
-
-
+from tests.conftest import file_digest, is_sorted, read_json
+
+
+@pytest.fixture(scope="module")
+def processed_audio(pipeline_outputs):
+    """
+    Decode input + output audio of the cached pipeline run once.
+    
+    Returns (samples, sr) for input, speech and residual plus the
+    normalized input and its speech mask. Arrays are read-only; tests
+    share them.
+    """
+    run = pipeline_outputs(duration_sec=1.0)
+    stems_dir = run["job_dir"] / "separation" / "stems"
+    
+    decoded = {
+        "input": audio.read_wav(run["input_path"]),
+        "speech": audio.read_wav(stems_dir / "speech.wav"),
+        "residual": audio.read_wav(stems_dir / "residual.wav"),
+    }
+    input_samples, input_sr = decoded["input"]
+    input_normalized = audio.normalize_audio(input_samples, input_sr)
+    decoded["input_normalized"] = input_normalized
+    # Same mask the separation stage builds
+    decoded["speech_mask"] = audio.build_speech_mask(
+        input_normalized, sr=audio.CANONICAL_SAMPLE_RATE
+    )
+    
+    for key in ("input", "speech", "residual"):
+        decoded[key][0].setflags(write=False)
+    for key in ("input_normalized", "speech_mask"):
+        decoded[key].setflags(write=False)
+    return decoded
+
+
+@pytest.mark.xdist_group(name="dual_run")
 class TestDeterminism:
     """Test that pipeline produces identical outputs on repeated runs."""
 
-    def test_wav_outputs_byte_identical(self, tmp_path):
-        """Running pipeline twice produces byte-identical WAV files."""
-        # Create test input
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
-        
-        # Run pipeline twice
-        jobs_root = tmp_path / "jobs"
-        
-        run1 = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", "run1",
-        )
-        assert run1.returncode == 0
-        
-        run2 = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", "run2",
-        )
-        assert run2.returncode == 0
-        
-        # Compare WAV outputs
-        for stem in ["speech.wav", "residual.wav"]:
-            path1 = jobs_root / "run1" / "separation" / "stems" / stem
-            path2 = jobs_root / "run2" / "separation" / "stems" / stem
-            
-            bytes1 = path1.read_bytes()
-            bytes2 = path2.read_bytes()
-            
-            assert bytes1 == bytes2, f"{stem} not byte-identical"
-
-    def test_json_outputs_byte_identical(self, tmp_path):
-        """Running pipeline twice produces byte-identical JSON files."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
-        
-        jobs_root = tmp_path / "jobs"
-        
-        run1 = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", "run1",
+    # Status files are excluded: they carry run timestamps
+    @pytest.mark.parametrize("rel_path", [
+        "separation/stems/speech.wav",
+        "separation/stems/residual.wav",
+        "sqi/sqi.json",
+        "diarization/diarization.json",
+        "events/events.json",
+    ])
+    def test_output_byte_identical(self, dual_run, rel_path):
+        """Running pipeline twice produces byte-identical output files."""
+        job1, job2 = dual_run
+        
+        assert file_digest(job1 / rel_path) == file_digest(job2 / rel_path), (
+            f"{rel_path} not byte-identical"
         )
-        assert run1.returncode == 0
-        
-        run2 = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", "run2",
-        )
-        assert run2.returncode == 0
-        
-        # Compare JSON outputs (excluding timestamps in status.json)
-        json_files = [
-            "sqi/sqi.json",
-            "diarization/diarization.json",
-            "events/events.json",
-        ]
-        
-        for rel_path in json_files:
-            path1 = jobs_root / "run1" / rel_path
-            path2 = jobs_root / "run2" / rel_path
-            
-            content1 = path1.read_text()
-            content2 = path2.read_text()
-            
-            assert content1 == content2, f"{rel_path} not identical"
 
 
+@pytest.mark.xdist_group(name="shared_pipeline")
 class TestAudioInvariants:
     """Test audio output invariants."""
 
-    @pytest.fixture
-    def processed_audio(self, tmp_path):
-        """Run pipeline and return input + output audio data."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
-        
-        jobs_root = tmp_path / "jobs"
-        job_id = "invariant-test"
-        
-        result = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        assert result.returncode == 0
-        
-        job_dir = jobs_root / job_id
-        
-        return {
-            "input_path": input_wav,
-            "speech_path": job_dir / "separation" / "stems" / "speech.wav",
-            "residual_path": job_dir / "separation" / "stems" / "residual.wav",
-        }
-
     def test_output_is_mono(self, processed_audio):
         """Output WAVs are mono."""
-        for key in ["speech_path", "residual_path"]:
-            samples, sr = audio.read_wav(processed_audio[key])
+        for key in ["speech", "residual"]:
+            samples, sr = processed_audio[key]
             assert samples.ndim == 1, f"{key} is not mono"
 
     def test_output_sample_rate(self, processed_audio):
         """Output WAVs have 16kHz sample rate."""
-        for key in ["speech_path", "residual_path"]:
-            samples, sr = audio.read_wav(processed_audio[key])
+        for key in ["speech", "residual"]:
+            samples, sr = processed_audio[key]
             assert sr == 16000, f"{key} sample rate is {sr}, expected 16000"
 
-    def test_output_length_preserved(self, processed_audio):
+    def test_output_length_preserved(self, processed_audio, pipeline_outputs):
         """Output WAVs have same sample count as normalized input."""
-        # Load input and normalize
-        input_samples, input_sr = audio.read_wav(processed_audio["input_path"])
-        input_normalized = audio.normalize_audio(input_samples, input_sr)
+        input_normalized = processed_audio["input_normalized"]
+        stems_dir = pipeline_outputs(duration_sec=1.0)["job_dir"] / "separation" / "stems"
         
-        speech_samples, _ = audio.read_wav(processed_audio["speech_path"])
-        residual_samples, _ = audio.read_wav(processed_audio["residual_path"])
+        # Header frame counts (libsndfile); the stems' samples need not be decoded
+        speech_frames = sf.info(stems_dir / "speech.wav").frames
+        residual_frames = sf.info(stems_dir / "residual.wav").frames
         
-        assert len(speech_samples) == len(input_normalized)
-        assert len(residual_samples) == len(input_normalized)
+        assert speech_frames == len(input_normalized)
+        assert residual_frames == len(input_normalized)
 
-    def test_speech_plus_residual_equals_input(self, processed_audio):
+    @pytest.mark.parametrize("mask_kind", ["speech_mask", "all_zero", "all_one"])
+    def test_speech_plus_residual_equals_input(self, processed_audio, mask_kind):
         """speech + residual == input (tested in float32 before quantization)."""
-        # This test verifies the separation invariant
-        # We need to test BEFORE WAV quantization, so we compute fresh
-        
-        input_samples, input_sr = audio.read_wav(processed_audio["input_path"])
-        input_normalized = audio.normalize_audio(input_samples, input_sr)
-        
-        # Recompute separation (same as stage does)
-        mask = audio.build_speech_mask(input_normalized, sr=audio.CANONICAL_SAMPLE_RATE)
-        speech_float = input_normalized * mask
-        residual_float = input_normalized - speech_float
+        # This test verifies the separation invariant on audio.split_stems,
+        # BEFORE WAV quantization. all_zero / all_one take its
+        # short-circuit branches (pure music / pure speech input).
+        input_normalized = processed_audio["input_normalized"]
+        mask = processed_audio["speech_mask"]
+        if mask_kind == "all_zero":
+            mask = np.zeros_like(mask)
+        elif mask_kind == "all_one":
+            mask = np.ones_like(mask)
+        
+        speech_float, residual_float = audio.split_stems(input_normalized, mask)
+        
+        # Stems follow the documented definition
+        assert speech_float.dtype == input_normalized.dtype
+        assert residual_float.dtype == input_normalized.dtype
+        np.testing.assert_array_equal(
+            speech_float, np.where(mask.astype(bool), input_normalized, 0.0),
+            err_msg="speech != input * mask"
+        )
+        np.testing.assert_array_equal(
+            residual_float, input_normalized - speech_float,
+            err_msg="residual != input - speech"
+        )
         
-        # Verify invariant in float32
+        # Verify invariant in float32: the mask is 0/1, so x*m, x - x*m and
+        # their sum are each exact and the identity holds bit for bit
         reconstructed = speech_float + residual_float
-        np.testing.assert_array_almost_equal(
+        np.testing.assert_array_equal(
             reconstructed, input_normalized,
-            decimal=6,  # float32 precision
             err_msg="speech + residual != input"
         )
 
 
+@pytest.mark.xdist_group(name="shared_pipeline")
 class TestSqiMetrics:
     """Test SQI output correctness."""
 
     @pytest.fixture
-    def sqi_data(self, tmp_path):
-        """Run pipeline and return SQI data."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
-        
-        jobs_root = tmp_path / "jobs"
-        job_id = "sqi-test"
-        
-        result = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        assert result.returncode == 0
-        
-        sqi_path = jobs_root / job_id / "sqi" / "sqi.json"
-        return json.loads(sqi_path.read_text())
+    def sqi_data(self, pipeline_outputs):
+        """Run pipeline (cached per session) and return SQI data."""
+        job_dir = pipeline_outputs(duration_sec=1.0)["job_dir"]
+        return read_json(job_dir / "sqi" / "sqi.json")
 
     def test_sqi_has_all_locked_metrics(self, sqi_data):
         """SQI has exactly the locked metric set."""
@@ -226,28 +176,15 @@ class TestSqiMetrics:
         assert 0 <= metrics["speech_ratio"] <= 1
 
 
+@pytest.mark.xdist_group(name="shared_pipeline")
 class TestDiarizationOutput:
     """Test diarization output correctness."""
 
     @pytest.fixture
-    def diarization_data(self, tmp_path):
-        """Run pipeline and return diarization data."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
-        
-        jobs_root = tmp_path / "jobs"
-        job_id = "diarization-test"
-        
-        result = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        assert result.returncode == 0
-        
-        path = jobs_root / job_id / "diarization" / "diarization.json"
-        return json.loads(path.read_text())
+    def diarization_data(self, pipeline_outputs):
+        """Run pipeline (cached per session) and return diarization data."""
+        job_dir = pipeline_outputs(duration_sec=1.0)["job_dir"]
+        return read_json(job_dir / "diarization" / "diarization.json")
 
     def test_single_pseudo_speaker(self, diarization_data):
         """Only uses SPEAKER_00 pseudo-speaker."""
@@ -259,7 +196,7 @@ class TestDiarizationOutput:
         for speaker in diarization_data["speakers"]:
             segments = speaker["segments"]
             start_times = [s["start_s"] for s in segments]
-            assert start_times == sorted(start_times)
+            assert is_sorted(start_times)
 
     def test_segments_no_overlap(self, diarization_data):
         """Segments do not overlap."""
@@ -268,49 +205,36 @@ class TestDiarizationOutput:
             for i in range(len(segments) - 1):
                 assert segments[i]["end_s"] <= segments[i + 1]["start_s"]
 
-    def test_segments_within_duration(self, diarization_data, tmp_path):
+    def test_segments_within_duration(self, diarization_data, pipeline_outputs):
         """All segment times are within [0, duration]."""
-        # Duration should be 1.0 sec based on test fixture
+        # Input is canonical (16 kHz mono), so its duration is the stems' duration.
+        # Taken from the file's header, not from decoded samples
+        info = sf.info(pipeline_outputs(duration_sec=1.0)["input_path"])
+        duration = info.frames / info.samplerate
         for speaker in diarization_data["speakers"]:
             for seg in speaker["segments"]:
                 assert seg["start_s"] >= 0
-                assert seg["end_s"] <= 1.5  # Allow small tolerance
+                # Times are rounded to 6 decimals
+                assert seg["end_s"] <= duration + 1e-6
 
 
+@pytest.mark.xdist_group(name="shared_pipeline")
 class TestEventsOutput:
     """Test events output correctness."""
 
     @pytest.fixture
-    def events_data(self, tmp_path):
-        """Run pipeline and return events data."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0, with_impulse=True)
-        
-        jobs_root = tmp_path / "jobs"
-        job_id = "events-test"
-        
-        result = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", job_id,
-        )
-        assert result.returncode == 0
-        
-        path = jobs_root / job_id / "events" / "events.json"
-        return json.loads(path.read_text())
-
-    def test_events_type_is_impulsive_sound(self, events_data):
-        """All events have type 'impulsive_sound'."""
-        for event in events_data["events"]:
-            assert event["type"] == "impulsive_sound"
+    def events_data(self, pipeline_outputs):
+        """Run pipeline (cached per session) and return events data."""
+        job_dir = pipeline_outputs(duration_sec=1.0, with_impulse=True)["job_dir"]
+        return read_json(job_dir / "events" / "events.json")
 
-    def test_events_confidence_is_fixed(self, events_data):
-        """All events have confidence 1.0 (schema requirement)."""
+    def test_event_invariants(self, events_data):
+        """All events have type 'impulsive_sound' and confidence 1.0 (schema requirement)."""
         for event in events_data["events"]:
-            assert event["confidence"] == 1.0
+            assert event["type"] == "impulsive_sound", f"Unexpected type: {event}"
+            assert event["confidence"] == 1.0, f"Unexpected confidence: {event}"
 
     def test_events_sorted_by_start(self, events_data):
         """Events are sorted by start time."""
         start_times = [e["start_s"] for e in events_data["events"]]
-        assert start_times == sorted(start_times)
+        assert is_sorted(start_times)
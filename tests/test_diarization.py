@@ -10,63 +10,30 @@ Rules:
 - No tolerance-based asserts
 """
 
-import json
-import sys
-from pathlib import Path
-
 import numpy as np
-import pytest
-
-from soundmind import audio
-from tests.conftest import create_test_wav, run_cli
-
-# Import schema validation
-sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
-from validate_schema import load_schema, validate_document
-
-
-class TestDiarizationDeterminism:
-    """Test byte-identical diarization outputs."""
 
-    def test_byte_identical_diarization_json(self, tmp_path):
-        """Running pipeline twice produces byte-identical diarization.json."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
-
-        jobs_root = tmp_path / "jobs"
-
-        run1 = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", "run1",
-        )
-        assert run1.returncode == 0
+# Schema validation tools (tools/ is put on sys.path by tests/conftest.py)
+from validate_schema import validate_named
 
-        run2 = run_cli(
-            "run",
-            "--input", str(input_wav),
-            "--jobs-root", str(jobs_root),
-            "--job-id", "run2",
-        )
-        assert run2.returncode == 0
+from soundmind import audio
+from tests.conftest import read_json, run_cli
 
-        path1 = jobs_root / "run1" / "diarization" / "diarization.json"
-        path2 = jobs_root / "run2" / "diarization" / "diarization.json"
+# 1 s of the 200 Hz "speech" tone, built once; tests slice regions from it.
+# Float64 time ramp, cast after scaling, so slices match per-region synthesis.
+_T = np.arange(audio.CANONICAL_SAMPLE_RATE) / audio.CANONICAL_SAMPLE_RATE
+_SIN200 = (0.3 * np.sin(2 * np.pi * 200 * _T)).astype(np.float32)
 
-        bytes1 = path1.read_bytes()
-        bytes2 = path2.read_bytes()
 
-        assert bytes1 == bytes2, "diarization.json not byte-identical"
+# Byte-identical diarization.json across runs is covered by
+# test_determinism.TestDeterminism.test_output_byte_identical
 
 
 class TestDiarizationSchema:
     """Test schema compliance."""
 
-    def test_schema_validation(self, tmp_path):
+    def test_schema_validation(self, tmp_path, test_wav_factory):
         """Diarization output validates against schema."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
+        input_wav = test_wav_factory(tmp_path / "input.wav", duration_sec=1.0)
 
         jobs_root = tmp_path / "jobs"
         job_id = "schema-test"
@@ -80,10 +47,9 @@ class TestDiarizationSchema:
         assert result.returncode == 0
 
         path = jobs_root / job_id / "diarization" / "diarization.json"
-        doc = json.loads(path.read_text())
+        doc = read_json(path)
 
-        schema = load_schema("diarization")
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "diarization")
 
         assert errors == [], f"Schema validation failed: {errors}"
 
@@ -91,10 +57,9 @@ class TestDiarizationSchema:
 class TestDiarizationSemantics:
     """Test Commit 7 semantic rules."""
 
-    def test_single_speaker_only(self, tmp_path):
+    def test_single_speaker_only(self, tmp_path, test_wav_factory):
         """Output contains exactly one speaker: SPEAKER_00."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
+        input_wav = test_wav_factory(tmp_path / "input.wav", duration_sec=1.0)
 
         jobs_root = tmp_path / "jobs"
         job_id = "speaker-test"
@@ -108,17 +73,16 @@ class TestDiarizationSemantics:
         assert result.returncode == 0
 
         path = jobs_root / job_id / "diarization" / "diarization.json"
-        doc = json.loads(path.read_text())
+        doc = read_json(path)
 
         # Must have exactly one speaker entry (or empty if no speech)
         if doc["speakers"]:
             assert len(doc["speakers"]) == 1
             assert doc["speakers"][0]["speaker_id"] == "SPEAKER_00"
 
-    def test_segment_times_six_decimals(self, tmp_path):
+    def test_segment_times_six_decimals(self, tmp_path, test_wav_factory):
         """Segment times are rounded to 6 decimal places."""
-        input_wav = tmp_path / "input.wav"
-        create_test_wav(input_wav, duration_sec=1.0)
+        input_wav = test_wav_factory(tmp_path / "input.wav", duration_sec=1.0)
 
         jobs_root = tmp_path / "jobs"
         job_id = "decimal-test"
@@ -132,7 +96,7 @@ class TestDiarizationSemantics:
         assert result.returncode == 0
 
         path = jobs_root / job_id / "diarization" / "diarization.json"
-        doc = json.loads(path.read_text())
+        doc = read_json(path)
 
         for speaker in doc["speakers"]:
             for seg in speaker["segments"]:
@@ -163,16 +127,14 @@ class TestDiarizationNoMerging:
         # Region 1: 0.1s to 0.4s (0.3s duration, >= 0.2s threshold)
         r1_start = int(0.1 * sr)
         r1_end = int(0.4 * sr)
-        t1 = np.arange(r1_end - r1_start) / sr
-        samples[r1_start:r1_end] = (0.3 * np.sin(2 * np.pi * 200 * t1)).astype(np.float32)
+        samples[r1_start:r1_end] = _SIN200[:r1_end - r1_start]
 
         # Gap: 0.4s to 0.5s (0.1s gap - would be merged in Commit 6, NOT in Commit 7)
 
         # Region 2: 0.5s to 0.8s (0.3s duration, >= 0.2s threshold)
         r2_start = int(0.5 * sr)
         r2_end = int(0.8 * sr)
-        t2 = np.arange(r2_end - r2_start) / sr
-        samples[r2_start:r2_end] = (0.3 * np.sin(2 * np.pi * 200 * t2)).astype(np.float32)
+        samples[r2_start:r2_end] = _SIN200[:r2_end - r2_start]
 
         input_wav = tmp_path / "input.wav"
         audio.write_wav(input_wav, samples, sr)
@@ -189,7 +151,7 @@ class TestDiarizationNoMerging:
         assert result.returncode == 0
 
         path = jobs_root / job_id / "diarization" / "diarization.json"
-        doc = json.loads(path.read_text())
+        doc = read_json(path)
 
         # With no merging, we expect 2 separate segments
         if doc["speakers"]:
@@ -214,8 +176,7 @@ class TestDiarizationShortRuns:
         # Short region: 0.1s to 0.19s (0.09s duration, < 0.2s threshold)
         short_start = int(0.1 * sr)
         short_end = int(0.19 * sr)
-        t = np.arange(short_end - short_start) / sr
-        samples[short_start:short_end] = (0.3 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+        samples[short_start:short_end] = _SIN200[:short_end - short_start]
 
         input_wav = tmp_path / "input.wav"
         audio.write_wav(input_wav, samples, sr)
@@ -232,7 +193,7 @@ class TestDiarizationShortRuns:
         assert result.returncode == 0
 
         path = jobs_root / job_id / "diarization" / "diarization.json"
-        doc = json.loads(path.read_text())
+        doc = read_json(path)
 
         # Short run should be dropped, so no segments or empty speaker list
         if doc["speakers"]:
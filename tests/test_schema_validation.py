@@ -4,16 +4,17 @@ SoundMind v1 Schema Validation Tests
 Tests that frozen schemas are valid and correctly validate documents.
 """
 
-import json
 from pathlib import Path
 
 import pytest
 
-# Import validation functions from tools
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
-from validate_schema import load_schema, validate_document, SCHEMA_FILES
-
+# Validation functions from tools (put on sys.path by tests/conftest.py)
+from validate_schema import (
+    get_validator,
+    load_schema,
+    validate_document,
+    validate_named,
+)
 
 SCHEMA_DIR = Path(__file__).parent.parent / "schemas"
 
@@ -40,15 +41,25 @@ class TestSchemaLoading:
         with pytest.raises(ValueError, match="Unknown schema"):
             load_schema("invalid_schema")
 
+    def test_schema_loaded_once(self):
+        assert load_schema("diarization") is load_schema("diarization")
+
+    def test_validator_built_once_per_schema(self):
+        assert get_validator("events") is get_validator("events")
+        with pytest.raises(ValueError, match="Unknown schema"):
+            get_validator("invalid_schema")
+
+    def test_validate_named_matches_validate_document(self):
+        doc = {"events": [{"type": "gunshot"}]}
+        expected = validate_document(doc, load_schema("events"))
+        assert expected
+        assert validate_named(doc, "events") == expected
+
 
 class TestStatusSchemaValidation:
     """Test status.schema.json validation."""
 
-    @pytest.fixture
-    def schema(self):
-        return load_schema("status")
-
-    def test_valid_minimal_status(self, schema):
+    def test_valid_minimal_status(self):
         doc = {
             "job_id": "test-123",
             "created_at": "2024-01-01T00:00:00Z",
@@ -62,10 +73,10 @@ class TestStatusSchemaValidation:
                 "events": None
             }
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "status")
         assert errors == []
 
-    def test_valid_complete_status(self, schema):
+    def test_valid_complete_status(self):
         doc = {
             "job_id": "test-456",
             "created_at": "2024-01-01T12:00:00Z",
@@ -100,20 +111,20 @@ class TestStatusSchemaValidation:
                 }
             }
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "status")
         assert errors == []
 
-    def test_missing_job_id_fails(self, schema):
+    def test_missing_job_id_fails(self):
         doc = {
             "created_at": "2024-01-01T00:00:00Z",
             "input": {"original_wav": "/path.wav", "sha256": "abc"},
             "stages": {"separation": None, "diarization": None, "events": None}
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "status")
         assert len(errors) == 1
         assert "job_id" in errors[0]
 
-    def test_extra_property_fails(self, schema):
+    def test_extra_property_fails(self):
         doc = {
             "job_id": "test",
             "created_at": "2024-01-01T00:00:00Z",
@@ -121,7 +132,7 @@ class TestStatusSchemaValidation:
             "stages": {"separation": None, "diarization": None, "events": None},
             "extra_field": "not_allowed"
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "status")
         assert len(errors) == 1
         assert "extra_field" in errors[0]
 
@@ -129,11 +140,7 @@ class TestStatusSchemaValidation:
 class TestDiarizationSchemaValidation:
     """Test diarization.schema.json validation."""
 
-    @pytest.fixture
-    def schema(self):
-        return load_schema("diarization")
-
-    def test_valid_diarization(self, schema):
+    def test_valid_diarization(self):
         doc = {
             "sample_rate": 16000,
             "speakers": [
@@ -152,19 +159,19 @@ class TestDiarizationSchemaValidation:
                 }
             ]
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "diarization")
         assert errors == []
 
-    def test_valid_with_notes(self, schema):
+    def test_valid_with_notes(self):
         doc = {
             "sample_rate": 44100,
             "speakers": [],
             "notes": "No speakers detected in audio"
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "diarization")
         assert errors == []
 
-    def test_timestamps_must_be_numbers(self, schema):
+    def test_timestamps_must_be_numbers(self):
         doc = {
             "sample_rate": 16000,
             "speakers": [{
@@ -172,26 +179,22 @@ class TestDiarizationSchemaValidation:
                 "segments": [{"start_s": "0.0", "end_s": 5.0}]  # string not allowed
             }]
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "diarization")
         assert len(errors) == 1
 
-    def test_sample_rate_must_be_integer(self, schema):
+    def test_sample_rate_must_be_integer(self):
         doc = {
             "sample_rate": 16000.5,  # float not allowed
             "speakers": []
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "diarization")
         assert len(errors) == 1
 
 
 class TestEventsSchemaValidation:
     """Test events.schema.json validation."""
 
-    @pytest.fixture
-    def schema(self):
-        return load_schema("events")
-
-    def test_valid_events(self, schema):
+    def test_valid_events(self):
         doc = {
             "events": [
                 {
@@ -214,15 +217,15 @@ class TestEventsSchemaValidation:
                 }
             ]
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "events")
         assert errors == []
 
-    def test_empty_events_valid(self, schema):
+    def test_empty_events_valid(self):
         doc = {"events": []}
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "events")
         assert errors == []
 
-    def test_invalid_event_type_fails(self, schema):
+    def test_invalid_event_type_fails(self):
         doc = {
             "events": [{
                 "type": "gunshot",  # not in enum
@@ -231,11 +234,11 @@ class TestEventsSchemaValidation:
                 "confidence": 0.9
             }]
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "events")
         assert len(errors) == 1
         assert "gunshot" in errors[0] or "enum" in errors[0].lower()
 
-    def test_confidence_out_of_range_fails(self, schema):
+    def test_confidence_out_of_range_fails(self):
         doc = {
             "events": [{
                 "type": "impulsive_sound",
@@ -244,10 +247,10 @@ class TestEventsSchemaValidation:
                 "confidence": 1.5  # > 1.0
             }]
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "events")
         assert len(errors) == 1
 
-    def test_missing_required_field_fails(self, schema):
+    def test_missing_required_field_fails(self):
         doc = {
             "events": [{
                 "type": "impulsive_sound",
@@ -255,7 +258,7 @@ class TestEventsSchemaValidation:
                 # missing end_s and confidence
             }]
         }
-        errors = validate_document(doc, schema)
+        errors = validate_named(doc, "events")
         assert len(errors) >= 1
 
 
@@ -17,12 +17,12 @@ Example:
 import argparse
 import json
 import sys
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     import jsonschema
-except ImportError:
-    sys.exit("Error: jsonschema package required. Install with: pip install jsonschema")
 
 
 SCHEMA_DIR = Path(__file__).parent.parent / "schemas"
@@ -34,14 +34,25 @@ SCHEMA_FILES = {
 }
 
 
+@cache
 def load_schema(schema_name: str) -> dict:
-    """Load a schema by name."""
+    """
+    Load a schema by name.
+    
+    Each schema file is read and parsed once per process; every call
+    returns the same dict, so callers must not modify it.
+    """
     if schema_name not in SCHEMA_FILES:
         raise ValueError(f"Unknown schema: {schema_name}. Valid: {list(SCHEMA_FILES.keys())}")
     
     schema_path = SCHEMA_DIR / SCHEMA_FILES[schema_name]
-    with open(schema_path, "r") as f:
-        return json.load(f)
+    return json.loads(schema_path.read_bytes())
+
+
+@cache
+def get_validator(schema_name: str) -> "jsonschema.Draft7Validator":
+    """Build the validator for a named schema once per process."""
+    return _draft7_validator(load_schema(schema_name))
 
 
 def validate_document(document: dict, schema: dict) -> list[str]:
@@ -51,7 +62,36 @@ def validate_document(document: dict, schema: dict) -> list[str]:
     Returns:
         List of error messages (empty if valid).
     """
-    validator = jsonschema.Draft7Validator(schema)
+    return _collect_errors(_draft7_validator(schema), document)
+
+
+def validate_named(document: dict, schema_name: str) -> list[str]:
+    """
+    Validate a document against a named schema's cached validator.
+    
+    Returns:
+        List of error messages (empty if valid), as validate_document().
+    """
+    return _collect_errors(get_validator(schema_name), document)
+
+
+def _draft7_validator(schema: dict) -> "jsonschema.Draft7Validator":
+    """
+    Build a Draft 7 validator, importing jsonschema on first use.
+    
+    Importing this module stays cheap (test collection imports it);
+    jsonschema is only loaded once a document is actually validated.
+    """
+    try:
+        import jsonschema
+    except ImportError:
+        sys.exit("Error: jsonschema package required. Install with: pip install jsonschema")
+    
+    return jsonschema.Draft7Validator(schema)
+
+
+def _collect_errors(validator: "jsonschema.Draft7Validator", document: dict) -> list[str]:
+    """Format each validation error as "<path>: <message>"."""
     errors = []
     for error in validator.iter_errors(document):
         path = ".".join(str(p) for p in error.absolute_path) or "(root)"
@@ -76,23 +116,22 @@ def main():
     
     args = parser.parse_args()
     
-    # Load schema
+    # Load schema (cached; validate_named() reuses it)
     try:
-        schema = load_schema(args.schema)
+        load_schema(args.schema)
     except FileNotFoundError:
         sys.exit(f"Error: Schema file not found: {SCHEMA_DIR / SCHEMA_FILES[args.schema]}")
     
     # Load document
     try:
-        with open(args.json_file, "r") as f:
-            document = json.load(f)
+        document = json.loads(args.json_file.read_bytes())
     except FileNotFoundError:
         sys.exit(f"Error: File not found: {args.json_file}")
     except json.JSONDecodeError as e:
         sys.exit(f"Error: Invalid JSON: {e}")
     
     # Validate
-    errors = validate_document(document, schema)
+    errors = validate_named(document, args.schema)
     
     if errors:
         print(f"INVALID: {len(errors)} error(s) found:")